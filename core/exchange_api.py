@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import ccxt
+import itertools
+import threading
 import time
 import hmac
 import hashlib
@@ -34,6 +36,20 @@ CROSS_LEVERAGE = 7.0
 BYBIT_CATEGORY = "linear"
 
 
+# 스냅샷 TTL (초): FULL_EXIT/재배치 버스트 중 동일 엔드포인트 중복 조회 흡수용.
+# 60초 재배치 주기 대비 무시 가능한 staleness.
+_SNAP_TTL_SEC = 0.25
+
+# orderLinkId 시퀀스: 기동 시각(ms)으로 1회 시드 → 재기동 간에도 겹치지 않고,
+# 이후에는 per-call 시계 읽기 없이 C-레벨 증가 1회로 충돌 없는 단조 ID 생성
+_LINK_SEQ = itertools.count(time.time_ns() // 1_000_000)
+
+
+def _make_order_link_id(base_tag: str) -> str:
+    """클라이언트 orderLinkId 생성 (Bybit 최대 36자) — 단조 카운터 기반."""
+    return f"{base_tag}_{next(_LINK_SEQ)}"
+
+
 class ExchangeAPI:
     """
     v10.1 WaveBot 시스템 환경 래퍼.
@@ -51,6 +67,11 @@ class ExchangeAPI:
         self.leverage: float = CROSS_LEVERAGE
         self.dry_run: bool = bool(DRY_RUN)
 
+        # 초단기 스냅샷 캐시: key -> (monotonic ts, value)
+        # (get_positions / get_order_status 버스트 시 REST 중복 호출 방지)
+        self._snap_lock = threading.Lock()
+        self._snap_cache: Dict[Any, Tuple[float, Any]] = {}
+
         # config 값을 참고는 하되, 여기서 환경을 강제 고정
         if CONFIG_SYMBOL != EXCHANGE_SYMBOL:
             logger.warning(
@@ -197,7 +218,17 @@ class ExchangeAPI:
     def get_positions(self) -> Dict[str, Dict[str, float]]:
         """
         현재 LONG / SHORT 포지션 정보 (수량, 평균 진입가)를 Bybit UTA 헤지 모드 기준으로 반환한다.
+
+        성공 응답은 _SNAP_TTL_SEC 동안 캐시된다 — FULL_EXIT 등 버스트 구간에서
+        여러 워커가 같은 창에 깨어나도 REST 는 1회만 나간다.
+        호출자에게는 매번 얕은 복사본을 반환한다 — 반환값을 수정해도
+        같은 TTL 창의 다른 호출자가 보는 스냅샷이 오염되지 않는다.
         """
+        with self._snap_lock:
+            hit = self._snap_cache.get("positions")
+            if hit is not None and (time.monotonic() - hit[0]) < _SNAP_TTL_SEC:
+                return self._copy_positions(hit[1])
+
         result: Dict[str, Dict[str, float]] = {
             "LONG": {"qty": 0.0, "avg_price": 0.0},
             "SHORT": {"qty": 0.0, "avg_price": 0.0},
@@ -271,7 +302,14 @@ class ExchangeAPI:
             result["SHORT"]["avg_price"],
         )
 
-        return result
+        with self._snap_lock:
+            self._snap_cache["positions"] = (time.monotonic(), result)
+        return self._copy_positions(result)
+
+    @staticmethod
+    def _copy_positions(snap: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+        """캐시된 포지션 스냅샷의 호출자 전달용 얕은 복사 (내부 dict 포함)."""
+        return {"LONG": dict(snap["LONG"]), "SHORT": dict(snap["SHORT"])}
 
     def get_open_orders(self) -> List[Dict[str, Any]]:
         """
@@ -372,6 +410,17 @@ class ExchangeAPI:
         reduce_only = side in (2, 4)
         return side_str, position_idx, reduce_only
 
+    # Market 주문 envelope 의 부분 평가(partial evaluation):
+    # side_code(1~4)가 (side_str, positionIdx, reduceOnly)를 완전히 결정하므로
+    # params 템플릿을 클래스 로드 시 1회 구성하고, 호출 시 얕은 복사만 한다.
+    # (버스트 슬라이싱 시 per-call dict 조립/분기 비용 제거)
+    _MARKET_SIDE_TEMPLATES: Dict[int, Tuple[str, Dict[str, Any]]] = {
+        1: ("buy", {"category": BYBIT_CATEGORY, "positionIdx": 1}),
+        2: ("buy", {"category": BYBIT_CATEGORY, "positionIdx": 2, "reduceOnly": True}),
+        3: ("sell", {"category": BYBIT_CATEGORY, "positionIdx": 2}),
+        4: ("sell", {"category": BYBIT_CATEGORY, "positionIdx": 1, "reduceOnly": True}),
+    }
+
     # ==========================================================
     # 주문: v10.1 정밀도 규칙 적용 (qty 기반)
     # ==========================================================
@@ -579,6 +628,94 @@ class ExchangeAPI:
             logger.error(f"[ExchangeAPI] Limit Order Fail: {e}")
             return ""
 
+    def place_batch_order(self, orders: List[Dict[str, Any]]) -> List[str]:
+        """
+        여러 LIMIT 주문을 배치로 발주 (Bybit V5 create-batch, 프레임당 최대 20개).
+
+        입력:
+          [{"side": int(side_code), "price": float, "qty": float}, ...]
+
+        반환:
+          입력과 같은 순서의 order_id 리스트 ("" = 해당 항목 실패)
+
+        ccxt 의 create_orders(배치 엔드포인트)가 없으면 단건 place_limit_order 로 폴백.
+        """
+        results: List[str] = []
+        if not orders:
+            return results
+
+        if self.dry_run:
+            for o in orders:
+                logger.info(
+                    "[DRY_RUN] place_batch_order(side=%s, price=%.2f, qty=%.6f)",
+                    o.get("side"), float(o.get("price", 0.0)), float(o.get("qty", 0.0)),
+                )
+                results.append("dry_id")
+            return results
+
+        has_batch = bool(getattr(self.exchange, "has", {}).get("createOrders")) and hasattr(
+            self.exchange, "create_orders"
+        )
+
+        for i in range(0, len(orders), 20):
+            chunk = orders[i:i + 20]
+            if has_batch:
+                requests = []
+                valid = True
+                for o in chunk:
+                    try:
+                        side_str, position_idx, reduce_only = self._side_int_to_ccxt(int(o["side"]))
+                        floored_price, final_qty = self._prepare_price_and_qty_from_qty(
+                            float(o["price"]), float(o["qty"])
+                        )
+                    except Exception as e:
+                        logger.warning("[ExchangeAPI] place_batch_order: bad spec %r (%s)", o, e)
+                        valid = False
+                        break
+                    if final_qty <= 0.0:
+                        logger.warning(
+                            "[ExchangeAPI] place_batch_order: qty=0 (minQty/stepSize 미만) → 단건 폴백 (req=%.6f)",
+                            float(o["qty"]),
+                        )
+                        valid = False
+                        break
+                    params: Dict[str, Any] = {
+                        "category": BYBIT_CATEGORY,
+                        "positionIdx": int(position_idx),
+                    }
+                    if reduce_only:
+                        params["reduceOnly"] = True
+                    tag = o.get("tag")
+                    if tag:
+                        params["orderLinkId"] = _make_order_link_id(str(tag))
+                    requests.append({
+                        "symbol": self.symbol,
+                        "type": "limit",
+                        "side": side_str,
+                        "amount": final_qty,
+                        "price": floored_price,
+                        "params": params,
+                    })
+
+                if valid:
+                    try:
+                        created = self._safe_request(self.exchange.create_orders, requests)
+                        oids = [str((c or {}).get("id", "")) for c in (created or [])]
+                        # 응답 길이가 요청보다 짧은 엣지 케이스 방어
+                        oids += [""] * (len(chunk) - len(oids))
+                        results.extend(oids[:len(chunk)])
+                        continue
+                    except Exception as e:
+                        logger.warning("[ExchangeAPI] create_orders batch failed (%s) → 단건 폴백", e)
+
+            # 배치 미지원/검증 실패/요청 실패 시 단건 폴백
+            for o in chunk:
+                results.append(
+                    self.place_limit_order(int(o["side"]), float(o["price"]), float(o["qty"]))
+                )
+
+        return results
+
     def place_market_order(
         self,
         side: int,
@@ -599,7 +736,14 @@ class ExchangeAPI:
             return "dry_id"
 
         try:
-            side_str, position_idx, reduce_only = self._side_int_to_ccxt(side)
+            template = self._MARKET_SIDE_TEMPLATES.get(int(side))
+            if template is not None:
+                side_str, base_params = template
+            else:
+                side_str, position_idx, reduce_only = self._side_int_to_ccxt(side)
+                base_params = {"category": BYBIT_CATEGORY, "positionIdx": position_idx}
+                if reduce_only:
+                    base_params["reduceOnly"] = True
 
             price_used = (
                 float(price_for_calc)
@@ -627,12 +771,8 @@ class ExchangeAPI:
                 )
                 return ""
 
-            params: Dict[str, Any] = {
-                "category": BYBIT_CATEGORY,
-                "positionIdx": position_idx,
-            }
-            if reduce_only:
-                params["reduceOnly"] = True
+            # ccxt 가 params 를 변형할 수 있으므로 템플릿은 얕은 복사해서 전달
+            params: Dict[str, Any] = dict(base_params)
 
             order = self.exchange.create_order(
                 self.symbol,
@@ -675,6 +815,102 @@ class ExchangeAPI:
             params={"category": BYBIT_CATEGORY},
         )
 
+    def cancel_batch_order(self, order_ids: List[str]) -> Dict[str, Optional[str]]:
+        """
+        여러 주문을 배치로 취소 (Bybit V5 cancel-batch, 프레임당 최대 20개).
+
+        반환:
+          {order_id: None(성공) | 에러 문자열(실패)}
+
+        ccxt 의 cancel_orders(배치 엔드포인트)가 없으면 단건 cancel_order 로 폴백.
+        """
+        results: Dict[str, Optional[str]] = {}
+        ids = [str(oid) for oid in order_ids if oid]
+        if not ids:
+            return results
+
+        if self.dry_run:
+            for oid in ids:
+                logger.info("[DRY_RUN] cancel_batch_order(%s)", oid)
+                results[oid] = None
+            return results
+
+        has_batch = bool(getattr(self.exchange, "has", {}).get("cancelOrders")) and hasattr(
+            self.exchange, "cancel_orders"
+        )
+
+        for i in range(0, len(ids), 20):
+            chunk = ids[i:i + 20]
+            if has_batch:
+                try:
+                    self._safe_request(
+                        self.exchange.cancel_orders,
+                        chunk,
+                        self.symbol,
+                        params={"category": BYBIT_CATEGORY},
+                    )
+                    for oid in chunk:
+                        results[oid] = None
+                    continue
+                except Exception as e:
+                    logger.warning("[ExchangeAPI] cancel_orders batch failed (%s) → 단건 폴백", e)
+
+            # 배치 미지원/실패 시 단건 폴백
+            for oid in chunk:
+                try:
+                    self.cancel_order(oid)
+                    results[oid] = None
+                except Exception as e:
+                    results[oid] = str(e)
+
+        return results
+
+    def cancel_replace_order(self, order_id: str, side: int, price: float, qty: float) -> str:
+        """
+        기존 주문을 amend 로 가격/수량 교체 (Bybit V5 /v5/order/amend).
+
+        cancel → create 2회 왕복 대신 1회 왕복으로 끝난다. Bybit amend 는
+        orderId 를 유지하므로 성공 시 입력 order_id 를 그대로 반환한다.
+        ccxt edit_order 미지원이면 "" 반환 → 호출 측이 cancel+create 폴백.
+        """
+        if self.dry_run:
+            logger.info(
+                "[DRY_RUN] cancel_replace_order(%s, side=%s, price=%.2f, qty=%.6f)",
+                order_id, side, price, qty,
+            )
+            return str(order_id)
+
+        if not (bool(getattr(self.exchange, "has", {}).get("editOrder")) and hasattr(self.exchange, "edit_order")):
+            return ""
+
+        side_str, position_idx, reduce_only = self._side_int_to_ccxt(side)
+        floored_price, final_qty = self._prepare_price_and_qty_from_qty(price, qty)
+        if final_qty <= 0.0:
+            logger.warning(
+                "[ExchangeAPI] cancel_replace_order: qty=0 (minQty/stepSize 미만) → 스킵 (req=%.6f)",
+                qty,
+            )
+            return ""
+
+        params: Dict[str, Any] = {
+            "category": BYBIT_CATEGORY,
+            "positionIdx": int(position_idx),
+        }
+        if reduce_only:
+            params["reduceOnly"] = True
+
+        edited = self._safe_request(
+            self.exchange.edit_order,
+            order_id,
+            self.symbol,
+            "limit",
+            side_str,
+            final_qty,
+            floored_price,
+            params=params,
+        )
+        return str((edited or {}).get("id", "") or order_id)
+
     def get_order_status(self, order_id: str) -> Dict[str, float]:
         """
         UTA(Bybit Unified) 계정에서 fetch_order(fetchOrder)가 막힌 케이스 대응.
@@ -686,10 +922,29 @@ class ExchangeAPI:
 
         반환:
           {"dealVol": float}  # 체결 수량
+
+        oid 별로 _SNAP_TTL_SEC 캐시 — 재배치 워커 여러 개가 같은 창에서
+        같은 주문을 조회해도 REST 는 1회만 나간다.
         """
         if self.dry_run:
             return {"dealVol": 999999.0}
 
+        key = ("order", str(order_id))
+        with self._snap_lock:
+            hit = self._snap_cache.get(key)
+            if hit is not None and (time.monotonic() - hit[0]) < _SNAP_TTL_SEC:
+                return hit[1]
+
+        result = self._get_order_status_uncached(order_id)
+
+        with self._snap_lock:
+            # per-oid 키 누적 방어: 작게 유지 (만료분 일괄 정리 대신 통째로 비움)
+            if len(self._snap_cache) > 256:
+                self._snap_cache.clear()
+            self._snap_cache[key] = (time.monotonic(), result)
+        return result
+
+    def _get_order_status_uncached(self, order_id: str) -> Dict[str, float]:
         params = {"category": BYBIT_CATEGORY}
 
         # 1) CCXT에 open/closed 단건 조회가 있으면 우선 사용
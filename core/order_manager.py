@@ -1,10 +1,18 @@
 from __future__ import annotations
 
 import asyncio
+import collections
+import concurrent.futures
+import functools
+import heapq
+import inspect
+import itertools
+import logging
 import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Callable, Tuple, Set, List
+from types import MappingProxyType
+from typing import Any, Dict, Optional, Callable, Tuple, Set, List, FrozenSet
 
 from core.exchange_api import exchange
 from utils.logger import logger
@@ -18,11 +26,115 @@ from strategy.liquidation_slicer import LiquidationSlicer
 
 MAX_SLICE_NOTIONAL = 70_000.0  # FULL_EXIT / ESCAPE 슬라이스 기준 (USDT)
 DEDUP_TTL_SEC = 15.0           # 동일 fingerprint 중복 발주 방지(재기동/연속실행 보호)
+_META_CAP = 5000               # _order_meta 상한 (WS gap 등으로 누수된 stale 메타 방어)
+_DEDUP_CAP = 4096              # _recent_fp LRU 상한
+_DEDUP_SWEEP = 8               # 삽입당 만료 fp 청소 개수 (상환 O(1))
+_OPEN_FPS_TTL_SEC = 0.5        # open-orders fingerprint 스냅샷 캐시 TTL
+
+# side_code 매핑 테이블 (logical side / raw side → side_code)
+# - 진입: LONG/BUY → 1(buy open), SHORT/SELL → 3(sell open)
+# - 청산: LONG/SELL → 4(sell reduce-only), SHORT/BUY → 2(buy reduce-only)
+# 미스 시 0 반환 → 호출 측에서 스킵 (로그는 slow path 에서만)
+_ENTRY_SIDE = {"LONG": 1, "BUY": 1, "SHORT": 3, "SELL": 3}
+_EXIT_SIDE = {"LONG": 4, "SELL": 4, "SHORT": 2, "BUY": 2}
+
+# side_code → (ccxt side, positionIdx, reduceOnly) 역매핑 (Hedge Mode 고정 규칙)
+# 기존의 tuple 멤버십 3회 분기 대신 dict 조회 1회. read-only 프록시로 오염 방지.
+_SIDE_INT_TABLE = MappingProxyType({
+    1: ("buy", 1, False),
+    2: ("buy", 2, True),
+    3: ("sell", 2, False),
+    4: ("sell", 1, True),
+})
+
+# positionIdx 유효성 비트마스크 (bit i = i 유효): Hedge Mode 는 1/2 만 허용
+_POS_IDX_VALID_MASK = 0b110
+
+# 버스트 슬라이싱 경로의 핫 로그 포맷 문자열 (per-call 리터럴 재생성 방지)
+_LOG_SLICE_EXIT = "[SliceExit] %s MARKET side=%s side_code=%s qty=%.6f oid=%s"
+_LOG_SLICE_EXIT_FAIL = "[SliceExit] %s MARKET failed side=%s side_code=%s qty=%.6f err=%s"
+_LOG_SLICE_ENTRY = "[SliceEntry] %s MARKET side=%s side_code=%s qty=%.6f oid=%s"
+_LOG_SLICE_ENTRY_FAIL = "[SliceEntry] %s MARKET failed side=%s side_code=%s qty=%.6f err=%s"
+
+
+def _feed_vols(feed: Optional[StrategyFeed]) -> Tuple[float, float]:
+    """
+    feed 의 (vol_1s, vol_1m) 스냅샷. 없으면 (0.0, 0.0).
+
+    vol_1s/vol_1m 은 StrategyFeed 의 정식 필드가 아니라 런타임에 주입될 수 있는
+    값이라 __dict__ 직접 조회로 getattr-기본값 경로를 피한다 (슬라이스 경로 호출).
+    """
+    if feed is None:
+        return 0.0, 0.0
+    d = feed.__dict__
+    v1s = d.get("vol_1s")
+    v1m = d.get("vol_1m")
+    return (float(v1s) if v1s else 0.0, float(v1m) if v1m else 0.0)
+
+
+def _f(v: Any) -> float:
+    """None/빈값 안전 float 변환 — `float(x or 0.0)` 관용구의 공용 헬퍼."""
+    return float(v) if v else 0.0
+
+
+_BOOL_TRUE = frozenset({"1", "true", "t", "yes", "y", "on", True, 1})
+_BOOL_FALSE = frozenset({"0", "false", "f", "no", "n", "off", "", False, 0, None})
+
+
+def _safe_bool(v: Any, default: bool = False) -> bool:
+    """
+    API bool 필드(reduceOnly 등) 파서.
+
+    frozenset 조회 O(1) — bool/int/str 공통 케이스에서 str 할당·선형 스캔 없이
+    판정하고, "false"/"0" 같은 truthy 문자열 함정도 올바르게 False 처리한다.
+    """
+    try:
+        if v in _BOOL_TRUE:
+            return True
+        if v in _BOOL_FALSE:
+            return False
+        return str(v).strip().lower() in _BOOL_TRUE
+    except Exception:
+        return default
+
+
+def _price_key(p: float) -> int:
+    """
+    fingerprint 용 가격 키: 센트 단위 정수 (int(p*100 + 0.5)).
+
+    round(p, 2) 대비 ~3배 저렴하고 banker's rounding 에 의존하지 않으며,
+    int 해시는 CPython 에서 사실상 no-op 이라 fp 집합 해싱이 싸진다.
+    """
+    return int(p * 100.0 + 0.5)
+
+
+def _qty_key(q: float) -> int:
+    """fingerprint 용 수량 키: 마이크로 BTC 단위 정수 (stepSize 0.001 을 여유 있게 커버)."""
+    return int(q * 1e6 + 0.5)
+
 
+def _pack_fp(side_str: str, price_key: int, position_idx: int, reduce_only: bool, qty_key: int = 0) -> int:
+    """
+    fingerprint 필드를 단일 64-bit int 로 패킹.
+
+    layout: bit0=side(buy=1), bit1-2=positionIdx, bit3=reduceOnly,
+    bit4~43=price_key(센트, 40bit), bit44~=qty_key(μBTC). int 해싱/비교는
+    튜플 대비 원소 순회·per-원소 해시가 없어 set 멤버십이 싸고, 엔트리당
+    메모리도 크게 줄어든다. qty 가 포함되므로 같은 가격이라도 수량이 바뀐
+    주문은 dedup 에 걸리지 않고 새로 발주된다.
+    """
+    return (
+        (1 if side_str == "buy" else 0)
+        | (position_idx << 1)
+        | ((1 if reduce_only else 0) << 3)
+        | (price_key << 4)
+        | (qty_key << 44)
+    )
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ApiOrderSpec:
-    """내부 표준 주문 스펙 (메타/로그용)"""
+    """내부 표준 주문 스펙 (메타/로그용, 불변)"""
     side: str
     qty: float
     price: Optional[float]
@@ -31,6 +143,28 @@ class ApiOrderSpec:
     tag: Optional[str] = None
 
 
+@dataclass(slots=True)
+class OrderMeta:
+    """
+    라이브 주문 1건의 메타 레코드 (60초 재배치용).
+
+    dict 레코드 대비 슬롯 기반이라 per-order 메모리가 절반 수준이고
+    속성 접근이 해시 조회 없이 C-level 오프셋으로 처리된다.
+    """
+    order_id: str
+    mode: str
+    kind: str
+    grid_index: int
+    wave_id: int
+    side: str
+    price: float
+    qty: float
+    created_ts: float              # wall-clock (로그/표시용)
+    tag: Optional[str]
+    reduce_only: bool = False
+    created_mono: float = 0.0      # monotonic (deadline/age 계산용 — NTP 점프 무관)
+
+
 class OrderManager:
     """
     v10.1 Order Execution Layer (정리본)
@@ -47,14 +181,56 @@ class OrderManager:
         self.logger = logger
 
         # Mode A 주문 메타 (60초 재배치용: 엔트리/그리드 주문만)
-        self._order_meta: Dict[str, Dict[str, Any]] = {}
+        # 삽입 순서 유지 OrderedDict — 상한 초과 시 가장 오래된 것부터 퇴출
+        self._order_meta: "collections.OrderedDict[str, OrderMeta]" = collections.OrderedDict()
+
+        # _order_meta / _recent_fp 변경(쓰기) 보호용 락.
+        # 읽기(.get)는 optimistic lock-free 유지 — GIL 하에서 단일 dict 연산은
+        # 원자적이고, free-threaded 빌드에서도 쓰기 직렬화만으로 구조가 깨지지
+        # 않는다. move_to_end/popitem 같은 복합 변이만 락 아래에서 수행한다.
+        self._meta_lock = threading.RLock()
+
+        # 중복 방지(단기 TTL): fp -> last monotonic ts
+        # bounded LRU — 상한 초과 시 가장 오래 안 쓰인 fp 퇴출, 삽입 시 만료분 일부 청소
+        self._recent_fp: "collections.OrderedDict[int, float]" = collections.OrderedDict()
+
+        # WS order-update 연동: oid -> terminal event / 체결 수량
+        # (notify_order_update 를 WS 콜백에서 호출하면 60초 대기를 조기 종료)
+        #
+        # 동시성 모델 (명시적 락 없음):
+        #   - _fill_state: 단일 writer(WS 스레드, dict.__setitem__) + 다중 reader
+        #     (재배치 워커/헤지 대기, dict.get/pop) — CPython dict 연산은 GIL 하에서
+        #     원자적이므로 락 없이 안전. 값은 float 프리미티브만 저장한다.
+        #   - _order_events: WS 스레드는 event.set() 만 호출 (threading.Event 는 스레드 안전)
+        self._order_events: Dict[str, threading.Event] = {}
+        self._fill_state: Dict[str, float] = {}
+
+        # Mode A 재배치 스케줄러: 주문당 스레드 대신 (due_ts, oid) heap + 단일 워커
+        self._replace_heap: List[Tuple[float, str]] = []
+        self._replace_cond = threading.Condition()
+        self._replace_thread: Optional[threading.Thread] = None
+
+        # TP 발주 함수 해석 캐시: (fn, call_mode) — 최초 1회 시그니처 introspection
+        self._tp_placer: Optional[Tuple[Callable[..., Any], str]] = None
+
+        # side_code 역매핑: exchange 구현이 있으면 바운드 메서드를 1회 캐시
+        # (per-call hasattr 제거 — 없으면 _SIDE_INT_TABLE fallback)
+        self._side_mapper: Optional[Callable[[int], Tuple[str, int, bool]]] = getattr(
+            self.exchange, "_side_int_to_ccxt", None
+        )
 
-        # 중복 방지(단기 TTL): fp -> last_ts
-        self._recent_fp: Dict[Tuple[str, float, int, bool], float] = {}
+        # open-orders fingerprint 스냅샷 캐시: (monotonic ts, fps)
+        self._open_fps_cache: Optional[Tuple[float, Set[int]]] = None
 
         # Market 슬라이스/override용 Slicer
         self.liquidation_slicer = LiquidationSlicer(max_slice_notional=MAX_SLICE_NOTIONAL)
 
+        # 거래소 I/O fan-out 용 워커 풀 (cancel 등 병렬 처리)
+        self._exec = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix="om-io")
+
+        # 감사 로그 전용 단일 워커 (FULL_EXIT 등 긴급 경로에서 I/O 를 분리)
+        self._audit_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="audit")
+
     # ==========================================================
     # Public: Mode A (GridDecision) — Maker 중심
     # ==========================================================
@@ -72,39 +248,76 @@ class OrderManager:
           - spec.reduce_only=True 인 주문은 TP 전용 경로로 분기(청산 side_code 사용)
           - DEDUP: 거래소 open orders에 동일 fp가 있으면 발주 스킵
         """
-        mode = getattr(decision, "mode", "UNKNOWN")
+        cancels = getattr(decision, "grid_cancels", None) or ()
+        entries = getattr(decision, "grid_entries", None) or ()
+        replaces = getattr(decision, "grid_replaces", None) or ()
 
-        self.logger.info(
-            "[OrderManager] apply_decision(mode=%s, cancels=%d, entries=%d, replaces=%d)",
-            mode,
-            len(getattr(decision, "grid_cancels", []) or []),
-            len(getattr(decision, "grid_entries", []) or []),
-            len(getattr(decision, "grid_replaces", []) or []),
-        )
+        # no-op decision (heartbeat 등): REST 호출/로그 없이 즉시 종료
+        if not (cancels or entries or replaces):
+            return
+
+        # INFO 비활성 시 len()/getattr 파생값 계산 자체를 건너뛴다 (lazy %-args 유지)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "[OrderManager] apply_decision(mode=%s, cancels=%d, entries=%d, replaces=%d)",
+                getattr(decision, "mode", "UNKNOWN"),
+                len(cancels),
+                len(entries),
+                len(replaces),
+            )
 
         # 0) open orders fingerprint 로드 (entries/replaces 있을 때만)
-        open_fps: Set[Tuple[str, float, int, bool]] = set()
-        if (getattr(decision, "grid_entries", None) or getattr(decision, "grid_replaces", None)):
-            open_fps = self._load_open_order_fps()
+        #    feed 스냅샷(WS, 무비용)과 REST 스냅샷을 한 번에 합쳐 frozenset 생성
+        open_fps: frozenset = frozenset()
+        if entries or replaces:
+            open_fps = frozenset(
+                itertools.chain(
+                    self._iter_feed_open_order_fps(feed),
+                    self._load_open_order_fps(),
+                )
+            )
 
         # 1) 취소 먼저 처리
-        for oid in getattr(decision, "grid_cancels", []) or []:
-            try:
-                self.exchange.cancel_order(oid)
-                self.logger.info("[GridCancel] Cancelled order_id=%s", oid)
-            except Exception as e:
-                self.logger.warning("[GridCancel] Cancel failed id=%s err=%s", oid, e)
-            finally:
-                # 60초 재배치 루프 중단되도록 메타 제거
-                self._order_meta.pop(oid, None)
-
-        # 2) 신규 Grid/TP 주문 생성
-        for spec in getattr(decision, "grid_entries", []) or []:
-            self._create_mode_a_order(spec, now_ts, open_fps=open_fps)
-
-        # 3) 재배치 생성 (실질적으로 새 주문 생성과 동일 취급)
-        for spec in getattr(decision, "grid_replaces", []) or []:
-            self._create_mode_a_order(spec, now_ts, open_fps=open_fps)
+        #    - cancel_batch_order 지원 시: 20개 단위 배치 (1*RTT)
+        #    - 미지원 시: 워커 풀 병렬 fan-out (ceil(N/8)*RTT)
+        if cancels:
+            # side 기준 정렬 후 디스패치: 거래소 측 rate-limit 버킷/keep-alive
+            # 재사용에 유리 (단일 심볼 봇이므로 symbol 키는 불필요).
+            # 메타 미보유 oid("")는 앞쪽에 모인다 — 순서만 안정적이면 충분.
+            meta_get = self._order_meta.get
+            cancels = sorted(cancels, key=lambda oid: getattr(meta_get(oid), "side", ""))
+            if hasattr(self.exchange, "cancel_batch_order"):
+                try:
+                    results = self.exchange.cancel_batch_order(list(cancels))
+                except Exception as e:
+                    self.logger.warning("[GridCancel] cancel_batch_order failed err=%s", e)
+                    results = {oid: str(e) for oid in cancels}
+                for oid in cancels:
+                    err = results.get(str(oid), None)
+                    if err is None:
+                        # 건당 성공 로그는 DEBUG — 대량 취소 시 INFO 큐를 점유하지 않도록
+                        self.logger.debug("[GridCancel] Cancelled order_id=%s", oid)
+                    else:
+                        self.logger.warning("[GridCancel] Cancel failed id=%s err=%s", oid, err)
+                    self._drop_order_tracking(oid)
+            else:
+                futs = {self._exec.submit(self.exchange.cancel_order, oid): oid for oid in cancels}
+                for f in concurrent.futures.as_completed(futs):
+                    oid = futs[f]
+                    try:
+                        f.result()
+                        self.logger.debug("[GridCancel] Cancelled order_id=%s", oid)
+                    except Exception as e:
+                        self.logger.warning("[GridCancel] Cancel failed id=%s err=%s", oid, e)
+                    finally:
+                        self._drop_order_tracking(oid)
+            self._invalidate_open_fps()
+
+        # 2) 신규 Grid/TP 주문 + 재배치 (재배치는 새 주문 생성과 동일 취급)
+        #    엔트리 스펙은 가능하면 배치 발주로 묶는다
+        self._create_mode_a_orders_batch(
+            list(entries) + list(replaces), now_ts, open_fps=open_fps
+        )
 
     # ==========================================================
     # Public: Mode B (EscapeDecision) — ESCAPE/HEDGE/FULL_EXIT
@@ -153,12 +366,13 @@ class OrderManager:
             try:
                 if not spec:
                     continue
-                qty = float(getattr(spec, "qty", 0.0) or 0.0)
+                # EscapeOrderSpec 은 __post_init__ 에서 type/side/qty 를 정규화한다.
+                qty = spec.qty
                 if qty <= 0:
                     continue
 
-                typ = str(getattr(spec, "type", "") or "").upper().strip()
-                side = str(getattr(spec, "side", "") or "").upper().strip()
+                typ = spec.type
+                side = spec.side
 
                 if typ == "HEDGE_ENTRY":
                     self.logger.info("[Escape] HEDGE_ENTRY side=%s qty=%.6f", side, qty)
@@ -184,107 +398,228 @@ class OrderManager:
             except Exception as exc:
                 self.logger.error("[OrderManager] apply_escape_decision failed: %s", exc)
 
+    def _drop_order_tracking(self, oid: str) -> None:
+        """취소/종결된 주문의 메타/WS 이벤트/체결 상태 정리 (재배치 루프 중단 포함)."""
+        with self._meta_lock:
+            self._order_meta.pop(oid, None)
+        self._fill_state.pop(oid, None)
+        evt = self._order_events.pop(oid, None)
+        if evt is not None:
+            evt.set()
+
     # ==========================================================
     # 내부: open orders -> fingerprint 로드 (DEDUP)
     # ==========================================================
 
-    def _load_open_order_fps(self) -> Set[Tuple[str, float, int, bool]]:
+    def _load_open_order_fps(self) -> Set[int]:
         """
-        fingerprint = (side_str, price, positionIdx, reduceOnly)
+        fingerprint = _pack_fp(side_str, price_key, positionIdx, reduceOnly)
         - side_str: "buy" / "sell"
-        - price: tick 반영된 가격(부동소수 오차 방지 위해 2자리 반올림)
+        - price_key: 센트 단위 정수 (_price_key)
         - positionIdx: 1/2
         - reduceOnly: bool
+
+        REST get_open_orders 스냅샷은 짧은 TTL(0.5초)로 캐시한다.
+        같은 tick 내 연속 호출이 RTT 를 반복 지불하지 않도록 하고,
+        발주/취소 성공 시 _invalidate_open_fps() 로 즉시 무효화한다.
         """
-        fps: Set[Tuple[str, float, int, bool]] = set()
+        cached = self._open_fps_cache
+        if cached is not None and (time.monotonic() - cached[0]) < _OPEN_FPS_TTL_SEC:
+            return cached[1]
+
+        fps: Set[int] = set()
         try:
             orders = self.exchange.get_open_orders()
         except Exception as exc:
             self.logger.warning("[DEDUP] get_open_orders failed: %s", exc)
             return fps
 
-        for o in orders or []:
-            try:
-                if not isinstance(o, dict):
-                    continue
-                info = o.get("info") or {}
-                side_raw = (o.get("side") or info.get("side") or "").lower()
-                if side_raw not in ("buy", "sell"):
-                    # CCXT는 보통 buy/sell로 오지만 방어
-                    side_raw = "buy" if "buy" in side_raw else ("sell" if "sell" in side_raw else "")
+        # 파싱 루프: per-order try/except 대신 명시적 precondition 체크 + .get 체인
+        # (수백 건 스냅샷에서 예외 프레임/중첩 분기 비용 제거)
+        fps_add = fps.add
+        _float = float
+        _int = int
+        for o in orders or ():
+            if not isinstance(o, dict):
+                continue
+            get = o.get
+            info = get("info") or {}
+            info_get = info.get
+
+            side_raw = (get("side") or info_get("side") or "").lower()
+            if side_raw != "buy" and side_raw != "sell":
+                # CCXT는 보통 buy/sell로 오지만 방어
+                side_raw = "buy" if "buy" in side_raw else ("sell" if "sell" in side_raw else "")
                 if not side_raw:
                     continue
 
-                px = o.get("price")
-                if px is None:
-                    px = info.get("price")
-                price = float(px or 0.0)
-                if price <= 0:
-                    continue
+            px = get("price")
+            if px is None:
+                px = info_get("price")
+            try:
+                price = _float(px or 0.0)
+            except (TypeError, ValueError):
+                continue
+            if price <= 0.0:
+                continue
 
-                pidx = info.get("positionIdx") or info.get("position_idx") or 0
-                try:
-                    position_idx = int(pidx)
-                except Exception:
-                    position_idx = 0
-                if position_idx not in (1, 2):
-                    continue
+            pidx = info_get("positionIdx") or info_get("position_idx") or 0
+            try:
+                position_idx = _int(pidx)
+            except (TypeError, ValueError):
+                continue
+            if position_idx != 1 and position_idx != 2:
+                continue
 
-                reduce_only = bool(info.get("reduceOnly") or info.get("isReduceOnly") or False)
+            ro_raw = info_get("reduceOnly")
+            if ro_raw is None:
+                ro_raw = info_get("isReduceOnly")
+            reduce_only = _safe_bool(ro_raw)
 
-                fps.add((side_raw, round(price, 2), position_idx, reduce_only))
-            except Exception:
-                continue
+            try:
+                order_qty = _float(get("amount") or info_get("qty") or 0.0)
+            except (TypeError, ValueError):
+                order_qty = 0.0
+
+            fps_add(_pack_fp(side_raw, _price_key(price), position_idx, reduce_only, _qty_key(order_qty)))
 
+        self._open_fps_cache = (time.monotonic(), fps)
         return fps
 
-    def _recent_dedup_hit(self, fp: Tuple[str, float, int, bool], now_ts: float) -> bool:
+    def _invalidate_open_fps(self) -> None:
+        """취소 성공 직후 open-orders fp 캐시 무효화 (다음 로드에서 전체 재동기화)."""
+        self._open_fps_cache = None
+
+    def _note_open_fp(self, fp: int) -> None:
+        """
+        발주 성공 직후 캐시된 스냅샷에 fp 를 증분 반영.
+
+        전체 무효화(→ REST 재조회) 대신 새 주문의 fp 만 더한다 — 같은 tick 의
+        후속 dedup 판정이 O(1) set 삽입만으로 최신 상태를 본다. 캐시가 비어
+        있으면 no-op (다음 _load_open_order_fps 가 전체 스냅샷으로 동기화).
+        """
+        cached = self._open_fps_cache
+        if cached is not None:
+            cached[1].add(fp)
+
+    def _iter_feed_open_order_fps(self, feed: Optional[StrategyFeed]):
+        """
+        feed.open_orders(WS 기반 OrderInfo 스냅샷)에서 fingerprint 를 생성하는 제너레이터.
+
+        OrderInfo 에는 positionIdx 가 없으므로 Hedge Mode 규칙으로 유도:
+          - 엔트리(BUY→LONG=1, SELL→SHORT=2)
+          - reduce-only(BUY→SHORT 청산=2, SELL→LONG 청산=1)
+        """
+        orders = getattr(feed, "open_orders", None) if feed is not None else None
+        if not orders:
+            return
+        for o in orders:
+            side = getattr(o, "side", "") or ""
+            price = float(getattr(o, "price", 0.0) or 0.0)
+            if price <= 0.0:
+                continue
+            reduce_only = bool(getattr(o, "reduce_only", False))
+            if side == "BUY":
+                side_raw = "buy"
+                position_idx = 2 if reduce_only else 1
+            elif side == "SELL":
+                side_raw = "sell"
+                position_idx = 1 if reduce_only else 2
+            else:
+                continue
+            yield _pack_fp(
+                side_raw,
+                _price_key(price),
+                position_idx,
+                reduce_only,
+                _qty_key(float(getattr(o, "qty", 0.0) or 0.0)),
+            )
+
+    def _recent_dedup_hit(self, fp: int, now_ts: float) -> bool:
         """
         단기 TTL DEDUP:
         - 동일 fp를 짧은 시간 내(DEDUP_TTL_SEC)에 또 발주하는 것을 방지
+
+        내부 시계는 monotonic (wall-clock 점프에 영향 없음 — now_ts 인자는
+        호환용으로 유지하되 TTL 판정에는 쓰지 않는다). 저장소는 bounded LRU:
+        hit 시 move_to_end, 삽입 시 만료된 oldest 를 최대 _DEDUP_SWEEP 개 청소,
+        상한(_DEDUP_CAP) 초과 시 가장 오래 안 쓰인 fp 퇴출.
         """
-        last = self._recent_fp.get(fp)
-        if last is not None and (now_ts - last) < DEDUP_TTL_SEC:
+        recent = self._recent_fp
+        now_mono = time.monotonic()
+
+        # optimistic read: 락 없이 조회, hit 시에만 락 잡고 LRU 갱신
+        last = recent.get(fp)
+        if last is not None and (now_mono - last) < DEDUP_TTL_SEC:
+            with self._meta_lock:
+                if fp in recent:
+                    recent.move_to_end(fp)
             return True
-        self._recent_fp[fp] = now_ts
+
+        with self._meta_lock:
+            # 만료된 oldest 를 소량만 정리 (삽입당 O(1) 상환)
+            expired_before = now_mono - DEDUP_TTL_SEC
+            for _ in range(_DEDUP_SWEEP):
+                if not recent:
+                    break
+                old_fp, old_ts = next(iter(recent.items()))
+                if old_ts >= expired_before:
+                    break
+                del recent[old_fp]
+
+            recent[fp] = now_mono
+            recent.move_to_end(fp)
+            if len(recent) > _DEDUP_CAP:
+                recent.popitem(last=False)
         return False
 
     # ==========================================================
     # 내부: side_code 매핑
     # ==========================================================
 
+    def _log_bad_side(self, logical_side: Any, where: str) -> int:
+        """알 수 없는 logical_side 로그용 (miss 경로 전용). 항상 0 반환."""
+        self.logger.error("[OrderManager] invalid logical_side=%r (%s)", logical_side, where)
+        return 0
+
     def _side_code_for_exit(self, logical_side: str) -> int:
         """
         logical_side:
           - "LONG"  → side_code=4 (Long 포지션 종료 = Sell reduce-only)
           - "SHORT" → side_code=2 (Short 포지션 종료 = Buy reduce-only)
+        미스 → 0 (호출 측에서 스킵)
         """
-        s = (logical_side or "").upper()
-        return 4 if s == "LONG" else 2
+        # fast path: 호출부는 이미 canonical("LONG"/"SHORT") 을 넘긴다 → .upper()/.strip() 생략
+        code = _EXIT_SIDE.get(logical_side)
+        if code is not None:
+            return code
+        return _EXIT_SIDE.get((logical_side or "").upper().strip(), 0) or self._log_bad_side(logical_side, "exit")
 
     def _side_code_for_entry(self, logical_side: str) -> int:
         """
         logical_side:
           - "LONG"  → side_code=1 (Long 진입 = Buy)
           - "SHORT" → side_code=3 (Short 진입 = Sell)
+        미스 → 0 (호출 측에서 스킵)
         """
-        s = (logical_side or "").upper()
-        return 1 if s == "LONG" else 3
+        # fast path: 호출부는 이미 canonical("LONG"/"SHORT") 을 넘긴다 → .upper()/.strip() 생략
+        code = _ENTRY_SIDE.get(logical_side)
+        if code is not None:
+            return code
+        return _ENTRY_SIDE.get((logical_side or "").upper().strip(), 0) or self._log_bad_side(logical_side, "entry")
 
     def _map_side_int(self, side_code: int) -> Tuple[str, int, bool]:
         """
         ExchangeAPI 내부 매핑(_side_int_to_ccxt)이 있으면 그대로 사용.
-        없으면 로컬 fallback.
+        없으면 로컬 테이블(_SIDE_INT_TABLE) fallback.
         """
-        if hasattr(self.exchange, "_side_int_to_ccxt"):
-            side_str, position_idx, reduce_only = self.exchange._side_int_to_ccxt(side_code)  # type: ignore[attr-defined]
+        fn = self._side_mapper
+        if fn is not None:
+            side_str, position_idx, reduce_only = fn(side_code)
             return str(side_str), int(position_idx), bool(reduce_only)
 
-        # fallback
-        side_str = "buy" if side_code in (1, 2) else "sell"
-        position_idx = 1 if side_code in (1, 4) else 2
-        reduce_only = side_code in (2, 4)
-        return side_str, position_idx, reduce_only
+        # fallback: 알 수 없는 코드는 기존 분기 규칙과 동일하게 ("sell", 2, False)
+        return _SIDE_INT_TABLE.get(side_code) or ("sell", 2, False)
 
     def _prepare_price_qty(self, price: float, qty: float) -> Tuple[float, float]:
         """
@@ -307,52 +642,57 @@ class OrderManager:
         *,
         position_idx_override: Optional[int] = None,
         reduce_only_override: Optional[bool] = None,
-    ) -> Tuple[str, float, int, bool]:
+    ) -> int:
         side_str, position_idx, reduce_only = self._map_side_int(side_code)
         if position_idx_override is not None:
             position_idx = int(position_idx_override)
         if reduce_only_override is not None:
             reduce_only = bool(reduce_only_override)
 
-        floored_price, _final_qty = self._prepare_price_qty(price, qty)
-        return (str(side_str).lower(), round(float(floored_price), 2), int(position_idx), bool(reduce_only))
+        floored_price, final_qty = self._prepare_price_qty(price, qty)
+        return _pack_fp(
+            str(side_str).lower(),
+            _price_key(float(floored_price)),
+            int(position_idx),
+            bool(reduce_only),
+            _qty_key(float(final_qty)),
+        )
 
     # ==========================================================
     # 내부: Mode A 주문 생성 (TP / Entry 분기)
     # ==========================================================
 
-    def _create_mode_a_order(self, spec: GridOrderSpec, now_ts: float, *, open_fps: Set[Tuple[str, float, int, bool]]) -> None:
+    def _create_mode_a_order(self, spec: GridOrderSpec, now_ts: float, *, open_fps: FrozenSet[int]) -> None:
         """
         GridOrderSpec 기반 LIMIT 주문 생성.
 
         - reduce_only=False: 엔트리(OPEN) side_code=1/3
         - reduce_only=True : TP(청산) side_code=2/4 + position_idx=1/2 반드시 필요
         """
-        side_str = str(getattr(spec, "side", "") or "").upper().strip()
+        # GridOrderSpec 은 __post_init__ 에서 side/price/qty 등을 정규화한다.
+        side_str = spec.side
         if side_str not in ("BUY", "SELL"):
-            self.logger.error("[OrderManager] invalid spec.side=%r", getattr(spec, "side", None))
+            self.logger.error("[OrderManager] invalid spec.side=%r", spec.side)
             return
 
-        price = float(getattr(spec, "price", 0.0) or 0.0)
-        qty = float(getattr(spec, "qty", 0.0) or 0.0)
+        price = spec.price
+        qty = spec.qty
         if price <= 0.0 or qty <= 0.0:
             self.logger.warning("[OrderManager] skip invalid spec price/qty price=%s qty=%s", price, qty)
             return
 
-        wave_id = int(getattr(spec, "wave_id", 0) or 0)
-        grid_index = int(getattr(spec, "grid_index", -1) or -1)
+        wave_id = spec.wave_id
+        grid_index = spec.grid_index
 
-        reduce_only = bool(getattr(spec, "reduce_only", False))
-        position_idx = getattr(spec, "position_idx", None)
-
-        tag = f"W{wave_id}_GRID_A_{grid_index}_{side_str}"
+        reduce_only = spec.reduce_only
+        position_idx = spec.position_idx
 
         # --------------------------
         # TP 경로 (reduce_only=True)
         # --------------------------
         if reduce_only:
             # position_idx 검증
-            if position_idx not in (1, 2):
+            if not (isinstance(position_idx, int) and 0 <= position_idx < 3 and (_POS_IDX_VALID_MASK >> position_idx) & 1):
                 self.logger.error(
                     "[OrderManager] TP(reduce_only=True) but invalid position_idx=%r (expected 1 or 2)",
                     position_idx,
@@ -366,19 +706,22 @@ class OrderManager:
                 logical = "CLOSE_SHORT"
                 side_code = 2  # buy reduce-only
 
-            # DEDUP (open orders)
+            # DEDUP (open orders) — tag 는 게이트 통과 후에만 조립 (스킵 경로 할당 절감)
             fp = self._fp_for_new_order(side_code, price, qty, position_idx_override=int(position_idx), reduce_only_override=True)
             if fp in open_fps:
-                self.logger.info("[DEDUP] skip TP (already open) fp=%s tag=%s", fp, tag)
+                self.logger.debug("[DEDUP] skip TP (already open) fp=%s wave=%s idx=%s", fp, wave_id, grid_index)
                 return
             if self._recent_dedup_hit(fp, now_ts):
-                self.logger.info("[DEDUP] skip TP (ttl-hit) fp=%s tag=%s", fp, tag)
+                self.logger.debug("[DEDUP] skip TP (ttl-hit) fp=%s wave=%s idx=%s", fp, wave_id, grid_index)
                 return
 
-            self.logger.info(
-                "[TP-LIMIT] logical=%s side=%s side_code=%s price=%.2f qty=%.6f position_idx=%s reduce_only=True tag=%s",
-                logical, side_str, side_code, price, qty, position_idx, tag,
-            )
+            tag = f"W{wave_id}_GRID_A_{grid_index}_{side_str}"
+
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    "[TP-LIMIT] logical=%s side=%s side_code=%s price=%.2f qty=%.6f position_idx=%s reduce_only=True tag=%s",
+                    logical, side_str, side_code, price, qty, position_idx, tag,
+                )
 
             try:
                 oid = self._place_tp_limit_order(side_code=side_code, price=price, qty=qty, position_idx=int(position_idx))
@@ -396,16 +739,41 @@ class OrderManager:
                 )
                 return
 
+            self._note_open_fp(fp)
+
             # TP는 60초 재배치(자동 cancel/repost) 하지 않음: 보호성 주문이므로 보수적으로 유지
-            self.logger.info(
-                "[GridEntry] oid=%s side=%s logical=%s grid_index=%d price=%.2f qty=%.6f tag=%s reduce_only=True position_idx=%s",
-                oid, side_str, logical, grid_index, price, qty, tag, position_idx,
-            )
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    "[GridEntry] oid=%s side=%s logical=%s grid_index=%d price=%.2f qty=%.6f tag=%s reduce_only=True position_idx=%s",
+                    oid, side_str, logical, grid_index, price, qty, tag, position_idx,
+                )
             return
 
         # --------------------------
         # Entry/DCA 경로 (reduce_only=False)
         # --------------------------
+        prep = self._prepare_entry_order(spec, now_ts, open_fps=open_fps)
+        if prep is None:
+            return
+        self._place_entry_order_single(prep, now_ts)
+
+    def _prepare_entry_order(
+        self,
+        spec: GridOrderSpec,
+        now_ts: float,
+        *,
+        open_fps: FrozenSet[int],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        엔트리(비 reduce-only) 스펙의 검증/게이트/DEDUP 처리.
+        통과 시 발주에 필요한 정보를 dict 로 반환, 스킵이면 None.
+        """
+        side_str = spec.side
+        price = spec.price
+        qty = spec.qty
+        wave_id = spec.wave_id
+        grid_index = spec.grid_index
+
         if side_str == "BUY":
             logical_side = "LONG"
             logical = "OPEN_LONG"
@@ -415,165 +783,416 @@ class OrderManager:
 
         side_code = self._side_code_for_entry(logical_side)
 
+        # tag 는 게이트 통과 후에만 조립 — 스킵이 다수인 tick 에서 f-string 할당 절감
         fp = self._fp_for_new_order(side_code, price, qty)
         if fp in open_fps:
-            self.logger.info("[DEDUP] skip ENTRY (already open) fp=%s tag=%s", fp, tag)
-            return
+            self.logger.debug("[DEDUP] skip ENTRY (already open) fp=%s wave=%s idx=%s", fp, wave_id, grid_index)
+            return None
         if self._recent_dedup_hit(fp, now_ts):
-            self.logger.info("[DEDUP] skip ENTRY (ttl-hit) fp=%s tag=%s", fp, tag)
-            return
+            self.logger.debug("[DEDUP] skip ENTRY (ttl-hit) fp=%s wave=%s idx=%s", fp, wave_id, grid_index)
+            return None
+
+        tag = f"W{wave_id}_GRID_A_{grid_index}_{side_str}"
+
+        return {
+            "side": side_str,
+            "logical": logical,
+            "side_code": side_code,
+            "price": price,
+            "qty": qty,
+            "wave_id": wave_id,
+            "grid_index": grid_index,
+            "tag": tag,
+            "fp": fp,
+        }
 
+    def _place_entry_order_single(self, prep: Dict[str, Any], now_ts: float) -> None:
+        """준비된 엔트리 주문 1건을 단건 REST 로 발주."""
         try:
-            oid = self.exchange.place_limit_order(side_code, price, qty)
+            oid = self.exchange.place_limit_order(prep["side_code"], prep["price"], prep["qty"])
         except Exception as exc:
             self.logger.error(
                 "[OrderManager] Mode A order failed side=%s logical=%s side_code=%s price=%s qty=%s err=%s",
-                side_str, logical, side_code, price, qty, exc,
+                prep["side"], prep["logical"], prep["side_code"], prep["price"], prep["qty"], exc,
             )
             return
 
         if not oid:
             self.logger.error(
                 "[OrderManager] Mode A order failed (empty oid) side=%s logical=%s side_code=%s price=%s qty=%s",
-                side_str, logical, side_code, price, qty,
+                prep["side"], prep["logical"], prep["side_code"], prep["price"], prep["qty"],
             )
             return
 
-        # 메타 저장(엔트리만) + 60초 재배치
-        self._order_meta[oid] = {
-            "order_id": oid,
-            "mode": "A",
-            "kind": "GRID",
-            "grid_index": grid_index,
-            "wave_id": wave_id,
-            "side": side_str,
-            "price": price,
-            "qty": qty,
-            "created_ts": now_ts,
-            "tag": tag,
-            "reduce_only": False,
-        }
+        self._register_entry_order(oid, prep, now_ts)
+
+    def _register_entry_order(self, oid: str, prep: Dict[str, Any], now_ts: float) -> None:
+        """발주 성공한 엔트리 주문의 메타 저장 + 60초 재배치 등록."""
+        with self._meta_lock:
+            self._order_meta[oid] = OrderMeta(
+                order_id=oid,
+                mode="A",
+                kind="GRID",
+                grid_index=prep["grid_index"],
+                wave_id=prep["wave_id"],
+                side=prep["side"],
+                price=prep["price"],
+                qty=prep["qty"],
+                created_ts=now_ts,
+                tag=prep["tag"],
+                created_mono=time.monotonic(),
+            )
 
-        self.logger.info(
-            "[GridEntry] oid=%s side=%s logical=%s grid_index=%d price=%.2f qty=%.6f tag=%s",
-            oid, side_str, logical, grid_index, price, qty, tag,
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "[GridEntry] oid=%s side=%s logical=%s grid_index=%d price=%.2f qty=%.6f tag=%s",
+                oid, prep["side"], prep["logical"], prep["grid_index"], prep["price"], prep["qty"], prep["tag"],
+            )
 
+        self._note_open_fp(prep["fp"])
         self._schedule_mode_a_replacement(oid)
+        self._evict_stale_meta()
+
+    def _create_mode_a_orders_batch(
+        self,
+        specs: List[GridOrderSpec],
+        now_ts: float,
+        *,
+        open_fps: FrozenSet[int],
+    ) -> None:
+        """
+        entries + replaces 를 한 번에 처리.
+
+        - TP(reduce_only=True) 스펙은 기존 단건 경로 유지
+        - 엔트리 스펙 2건 이상 + exchange.place_batch_order 지원 시:
+          20개 단위 배치 발주 (N*RTT → ceil(N/20)*RTT)
+        - 배치 항목별 실패는 단건 발주로 폴백
+        """
+        prepared: List[Dict[str, Any]] = []
+        for spec in specs:
+            if spec.reduce_only:
+                self._create_mode_a_order(spec, now_ts, open_fps=open_fps)
+                continue
+            # 단건 경로와 동일한 validation 선행
+            if spec.side not in ("BUY", "SELL"):
+                self.logger.error("[OrderManager] invalid spec.side=%r", spec.side)
+                continue
+            if spec.price <= 0.0 or spec.qty <= 0.0:
+                self.logger.warning(
+                    "[OrderManager] skip invalid spec price/qty price=%s qty=%s", spec.price, spec.qty
+                )
+                continue
+            prep = self._prepare_entry_order(spec, now_ts, open_fps=open_fps)
+            if prep is not None:
+                prepared.append(prep)
+
+        if not prepared:
+            return
+
+        batch_fn = getattr(self.exchange, "place_batch_order", None)
+        if batch_fn is None or len(prepared) == 1:
+            for prep in prepared:
+                self._place_entry_order_single(prep, now_ts)
+            return
+
+        for i in range(0, len(prepared), 20):
+            chunk = prepared[i:i + 20]
+            try:
+                oids = batch_fn([
+                    {"side": p["side_code"], "price": p["price"], "qty": p["qty"], "tag": p["tag"]}
+                    for p in chunk
+                ])
+            except Exception as exc:
+                self.logger.warning("[OrderManager] place_batch_order failed (%s) → 단건 폴백", exc)
+                for prep in chunk:
+                    self._place_entry_order_single(prep, now_ts)
+                continue
+
+            oids = list(oids or ())
+            oids += [""] * (len(chunk) - len(oids))
+            for prep, oid in zip(chunk, oids):
+                if oid:
+                    self._register_entry_order(str(oid), prep, now_ts)
+                else:
+                    # ExchangeAPI 내부에서 이미 단건 폴백까지 시도한 결과
+                    self.logger.error(
+                        "[OrderManager] Mode A batch order failed (empty oid) side=%s logical=%s price=%s qty=%s",
+                        prep["side"], prep["logical"], prep["price"], prep["qty"],
+                    )
 
     def _place_tp_limit_order(self, *, side_code: int, price: float, qty: float, position_idx: int) -> str:
         """
         TP 전용 LIMIT 발주:
         - 가능하면 ExchangeAPI의 TP 전용 함수를 우선 사용
         - 없으면 close side_code(2/4) 기반 place_limit_order로 fallback
+
+        함수명/수용 kwargs 해석은 최초 1회 시그니처 introspection 으로 캐시해서
+        주문마다 TypeError 사다리를 타지 않는다.
+        """
+        fn, mode = self._resolve_tp_placer()
+        try:
+            if mode == "kw":
+                return str(fn(side_code, price, qty, position_idx=position_idx, reduce_only=True))
+            if mode == "pidx":
+                return str(fn(side_code, price, qty, position_idx))
+            return str(fn(side_code, price, qty))
+        except TypeError:
+            # 캐시된 판단이 어긋난 경우(런타임에 구현 교체 등): 캐시 무효화 후 최소 경로
+            self._tp_placer = None
+            return str(fn(side_code, price, qty))
+
+    def _resolve_tp_placer(self) -> Tuple[Callable[..., Any], str]:
+        """
+        TP 발주 함수와 호출 방식("kw"/"pidx"/"plain")을 1회 해석해 캐시.
+
+        - "kw"    : position_idx/reduce_only 키워드 수용 (또는 **kwargs)
+        - "pidx"  : position_idx 만 4번째 인자로 수용
+        - "plain" : (side_code, price, qty) 만 — side_code=2/4 매핑에 의존
         """
-        # 여러 구현명을 방어적으로 지원
+        cached = self._tp_placer
+        if cached is not None:
+            return cached
+
+        fn: Optional[Callable[..., Any]] = None
         for name in ("place_tp_limit_order", "place_tp_limit", "place_limit_order_tp"):
-            if hasattr(self.exchange, name):
-                fn = getattr(self.exchange, name)
-                try:
-                    return str(fn(side_code, price, qty, position_idx=position_idx, reduce_only=True))
-                except TypeError:
-                    try:
-                        return str(fn(side_code, price, qty, position_idx))
-                    except TypeError:
-                        return str(fn(side_code, price, qty))
+            fn = getattr(self.exchange, name, None)
+            if fn is not None:
+                break
 
-        # fallback: side_code=2/4면 ExchangeAPI가 reduceOnly/positionIdx를 자동 매핑하는 구조여야 함
-        return str(self.exchange.place_limit_order(side_code, price, qty))
+        if fn is None:
+            # fallback: ExchangeAPI가 side_code=2/4에서 reduceOnly/positionIdx 자동 매핑
+            resolved = (self.exchange.place_limit_order, "plain")
+        else:
+            try:
+                params = inspect.signature(fn).parameters
+                has_var_kw = any(
+                    p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values()
+                )
+            except (TypeError, ValueError):
+                params, has_var_kw = {}, True
+            if has_var_kw or ("position_idx" in params and "reduce_only" in params):
+                resolved = (fn, "kw")
+            elif "position_idx" in params:
+                resolved = (fn, "pidx")
+            else:
+                resolved = (fn, "plain")
+
+        self._tp_placer = resolved
+        return resolved
 
     # ==========================================================
     # 내부: Mode A 60초 재배치(엔트리만)
     # ==========================================================
 
+    def notify_order_update(self, oid: str, filled_qty: float, *, terminal: bool = False) -> None:
+        """
+        거래소 WS order-update 콜백용 훅.
+
+        - filled_qty : 누적 체결 수량 (cumExecQty)
+        - terminal   : 주문이 종결 상태(Filled/Cancelled 등)면 True
+          → 60초 대기 중인 재배치 워커를 즉시 깨운다.
+
+        WS 스레드에서 호출되지만 락을 잡지 않는다: _fill_state 쓰기는
+        GIL-원자적 dict.__setitem__ 하나, 이벤트는 Event.set() 만 사용
+        (single-writer / lock-free reader 패턴 — __init__ 주석 참고).
+
+        누수 방어: 추적 중인 oid(_order_meta 또는 _order_events 대기자)가
+        아닌 주문(TP 주문, 이전 세션 잔존분 등)은 종결 이벤트에서 엔트리를
+        즉시 제거해 _fill_state 가 무한히 자라지 않게 한다.
+        """
+        filled = float(filled_qty or 0.0)
+        meta = self._order_meta.get(oid)
+        tracked = meta is not None or oid in self._order_events
+
+        if tracked or not terminal:
+            # 비종결 업데이트는 일단 기록 (placement 직후 waiter 등록 전의
+            # 레이스 윈도우에서도 체결값을 잃지 않기 위함)
+            self._fill_state[oid] = filled
+        if terminal and not tracked:
+            self._fill_state.pop(oid, None)
+
+        if meta is not None and filled >= meta.qty > 0.0:
+            terminal = True
+
+        if terminal:
+            evt = self._order_events.get(oid)
+            if evt is not None:
+                evt.set()
+            # Mode A 주문이면 재배치 deadline 을 즉시로 당겨서 60초를 기다리지 않는다
+            if meta is not None:
+                with self._replace_cond:
+                    heapq.heappush(self._replace_heap, (time.monotonic(), oid))
+                    self._replace_cond.notify()
+
+    def _evict_stale_meta(self) -> None:
+        """
+        _order_meta 상한 초과 시 가장 오래된 메타부터 퇴출.
+
+        재배치 워커가 죽거나 WS gap 으로 oid 가 영영 해소되지 않는 경우에 대한
+        누수 방어 — 정상 운영 범위(라이브 주문 수 << _META_CAP)에서는 no-op.
+        """
+        while len(self._order_meta) > _META_CAP:
+            with self._meta_lock:
+                if len(self._order_meta) <= _META_CAP:
+                    break
+                evicted_oid, evicted = self._order_meta.popitem(last=False)
+            self.logger.warning(
+                "[OrderManager] evicting stale meta oid=%s age=%.0fs",
+                evicted_oid,
+                time.monotonic() - evicted.created_mono if evicted.created_mono else -1.0,
+            )
+            self._fill_state.pop(evicted_oid, None)
+            self._order_events.pop(evicted_oid, None)
+
     def _schedule_mode_a_replacement(self, oid: str) -> None:
         try:
-            t = threading.Thread(target=self._mode_a_replacement_worker, args=(oid,), daemon=True)
-            t.start()
+            # deadline 은 wall-clock 이 아닌 monotonic 기준: NTP step/슬루에도 60초 보장
+            meta = self._order_meta.get(oid)
+            base = meta.created_mono if (meta is not None and meta.created_mono) else time.monotonic()
+            with self._replace_cond:
+                heapq.heappush(self._replace_heap, (base + 60.0, oid))
+                if self._replace_thread is None or not self._replace_thread.is_alive():
+                    self._replace_thread = threading.Thread(
+                        target=self._replacement_loop,
+                        name="om-replace",
+                        daemon=True,
+                    )
+                    self._replace_thread.start()
+                self._replace_cond.notify()
         except Exception as exc:
             self.logger.warning("[ModeA] failed to schedule replacement for oid=%s err=%s", oid, exc)
 
+    def _replacement_loop(self) -> None:
+        """
+        단일 스케줄러 루프:
+        - heap head 의 deadline 까지 조건변수 대기 (더 이른 push 가 오면 선점)
+        - due 가 지난 oid 만 꺼내서 worker 실행 (주문당 스레드 없음)
+        """
+        while True:
+            with self._replace_cond:
+                while not self._replace_heap:
+                    self._replace_cond.wait()
+                due, oid = self._replace_heap[0]
+                delay = due - time.monotonic()
+                if delay > 0:
+                    self._replace_cond.wait(timeout=delay)
+                    continue
+                heapq.heappop(self._replace_heap)
+
+            try:
+                self._mode_a_replacement_worker(oid)
+            except Exception as exc:
+                self.logger.warning("[ModeA] replacement worker failed oid=%s err=%s", oid, exc)
+
     def _mode_a_replacement_worker(self, oid: str) -> None:
-        try:
-            time.sleep(60.0)
-        except Exception:
-            return
+        # deadline 관리는 _replacement_loop(heap)가 담당; 여기서는 대기하지 않는다.
+        self._order_events.pop(oid, None)
 
         meta = self._order_meta.get(oid)
         if meta is None:
+            self._fill_state.pop(oid, None)
             return
 
-        side = str(meta.get("side", "")).upper()
-        price = float(meta.get("price") or 0.0)
-        original_qty = float(meta.get("qty") or 0.0)
-        tag = meta.get("tag")
+        side = meta.side
+        price = meta.price
+        original_qty = meta.qty
+        tag = meta.tag
 
         if price <= 0.0 or original_qty <= 0.0:
-            self._order_meta.pop(oid, None)
+            with self._meta_lock:
+                self._order_meta.pop(oid, None)
             return
 
-        try:
-            status = self.exchange.get_order_status(oid)
-            filled = float(status.get("dealVol", 0.0) or 0.0)
-        except Exception as exc:
-            self.logger.warning("[ModeA] get_order_status failed oid=%s err=%s", oid, exc)
-            return
+        # WS가 채워준 체결 상태가 있으면 REST get_order_status 호출 생략
+        filled_ws = self._fill_state.pop(oid, None)
+        if filled_ws is not None:
+            filled = float(filled_ws)
+        else:
+            try:
+                status = self.exchange.get_order_status(oid)
+                filled = float(status.get("dealVol", 0.0) or 0.0)
+            except Exception as exc:
+                self.logger.warning("[ModeA] get_order_status failed oid=%s err=%s", oid, exc)
+                return
 
         remaining = max(original_qty - filled, 0.0)
         if remaining <= 0.0:
-            self._order_meta.pop(oid, None)
-            self.logger.info("[ModeA] oid=%s fully filled before 60s, no re-post needed", oid)
+            with self._meta_lock:
+                self._order_meta.pop(oid, None)
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("[ModeA] oid=%s fully filled before 60s, no re-post needed", oid)
             return
 
-        # 기존 주문 cancel
-        try:
-            self.exchange.cancel_order(oid)
-        except Exception as exc:
-            self.logger.warning("[ModeA] cancel_order failed oid=%s err=%s", oid, exc)
-
-        self._order_meta.pop(oid, None)
-
         logical_side = "LONG" if side == "BUY" else "SHORT"
         side_code = self._side_code_for_entry(logical_side)
 
-        try:
-            new_oid = self.exchange.place_limit_order(side_code, price, remaining)
-        except Exception as exc:
-            self.logger.error(
-                "[ModeA] re-place order failed side=%s price=%s qty=%.6f err=%s",
-                side, price, remaining, exc,
-            )
-            return
+        # amend(cancel-replace) 지원 시 1회 왕복으로 교체 — 실패/미지원이면
+        # 기존 cancel + create 2회 왕복 폴백
+        new_oid = ""
+        amend = getattr(self.exchange, "cancel_replace_order", None)
+        if amend is not None:
+            try:
+                new_oid = amend(oid, side_code, price, remaining)
+            except Exception as exc:
+                self.logger.warning(
+                    "[ModeA] cancel_replace failed oid=%s err=%s (cancel+create 폴백)", oid, exc
+                )
+                new_oid = ""
 
-        if not new_oid:
-            self.logger.error("[ModeA] re-place order failed (empty oid) prev_oid=%s", oid)
-            return
+        if new_oid:
+            with self._meta_lock:
+                self._order_meta.pop(oid, None)
+        else:
+            # 기존 주문 cancel
+            try:
+                self.exchange.cancel_order(oid)
+            except Exception as exc:
+                self.logger.warning("[ModeA] cancel_order failed oid=%s err=%s", oid, exc)
 
-        self._order_meta[new_oid] = {
-            "order_id": new_oid,
-            "mode": "A",
-            "kind": meta.get("kind", "GRID"),
-            "grid_index": meta.get("grid_index"),
-            "wave_id": meta.get("wave_id"),
-            "side": side,
-            "price": price,
-            "qty": remaining,
-            "created_ts": time.time(),
-            "tag": tag,
-            "reduce_only": False,
-        }
+            with self._meta_lock:
+                self._order_meta.pop(oid, None)
 
-        self.logger.info(
-            "[ModeA] Re-posted GRID order oid=%s prev_oid=%s side=%s price=%.2f qty=%.6f tag=%s",
-            new_oid, oid, side, price, remaining, tag,
-        )
+            try:
+                new_oid = self.exchange.place_limit_order(side_code, price, remaining)
+            except Exception as exc:
+                self.logger.error(
+                    "[ModeA] re-place order failed side=%s price=%s qty=%.6f err=%s",
+                    side, price, remaining, exc,
+                )
+                return
+
+            if not new_oid:
+                self.logger.error("[ModeA] re-place order failed (empty oid) prev_oid=%s", oid)
+                return
+
+        with self._meta_lock:
+            self._order_meta[new_oid] = OrderMeta(
+                order_id=new_oid,
+                mode="A",
+                kind=meta.kind,
+                grid_index=meta.grid_index,
+                wave_id=meta.wave_id,
+                side=side,
+                price=price,
+                qty=remaining,
+                created_ts=time.time(),
+                tag=tag,
+                created_mono=time.monotonic(),
+            )
+
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "[ModeA] Re-posted GRID order oid=%s prev_oid=%s side=%s price=%.2f qty=%.6f tag=%s",
+                new_oid, oid, side, price, remaining, tag,
+            )
+        self._evict_stale_meta()
 
     # ==========================================================
     # 내부: FULL_EXIT + Market slicer (Mode B)
     # ==========================================================
 
     def _execute_full_exit(self, feed: StrategyFeed) -> None:
-        price = float(getattr(feed, "price", 0.0) or 0.0)
+        price = _f(getattr(feed, "price", None))
         if price <= 0.0:
             self.logger.error("[FullExit] invalid price=%.4f", price)
             return
@@ -587,41 +1206,110 @@ class OrderManager:
         long_pos = positions.get("LONG", {}) or {}
         short_pos = positions.get("SHORT", {}) or {}
 
-        long_qty = float(long_pos.get("qty", 0.0) or 0.0)
-        short_qty = float(short_pos.get("qty", 0.0) or 0.0)
+        long_qty = _f(long_pos.get("qty"))
+        short_qty = _f(short_pos.get("qty"))
 
         self.logger.info("[FullExit] positions LONG=%.6f SHORT=%.6f price=%.2f", long_qty, short_qty, price)
 
+        state = getattr(feed, "state", None)
         positions_before = {
-            "LONG": {"qty": long_qty, "avg_price": float(long_pos.get("avg_price", 0.0) or 0.0)},
-            "SHORT": {"qty": short_qty, "avg_price": float(short_pos.get("avg_price", 0.0) or 0.0)},
-            "HEDGE": {"qty": float(getattr(getattr(feed, "state", None), "hedge_size", 0.0) or 0.0),
-                      "side": getattr(getattr(feed, "state", None), "hedge_side", None)},
+            "LONG": {"qty": long_qty, "avg_price": _f(long_pos.get("avg_price"))},
+            "SHORT": {"qty": short_qty, "avg_price": _f(short_pos.get("avg_price"))},
+            "HEDGE": {"qty": _f(getattr(state, "hedge_size", None)),
+                      "side": getattr(state, "hedge_side", None)},
         }
 
-        try:
-            log_full_exit_trigger(
-                self.logger,
-                pnl_total_pct=float(getattr(feed, "pnl_total_pct", 0.0) or 0.0),
-                wave_id=getattr(getattr(feed, "state", None), "wave_id", 0),
-                positions_before=positions_before,
+        # 감사 로그는 백그라운드 워커로 분리 → 첫 청산 슬라이스가 I/O 를 기다리지 않는다
+        self._audit_pool.submit(
+            self._safe_audit,
+            log_full_exit_trigger,
+            self.logger,
+            pnl_total_pct=_f(getattr(feed, "pnl_total_pct", None)),
+            wave_id=getattr(state, "wave_id", 0),
+            positions_before=positions_before,
+        )
+
+        # 양방향 청산 시 LONG/SHORT 슬라이스를 병렬 실행
+        # (슬라이서는 슬라이스 사이 1초 sleep → 순차 실행이면 wall time 이 양측 합산)
+        if long_qty > 0.0 and short_qty > 0.0:
+            # high-vol override 판단은 양측 합산 notional 로 1회만 수행
+            # → 한쪽만 all-in 하고 다른 쪽은 계속 슬라이스하는 엇박을 방지
+            vol_1s, vol_1m = _feed_vols(feed)
+            agg_plan = self.liquidation_slicer.plan_close_notional(
+                (long_qty + short_qty) * price, vol_1s=vol_1s, vol_1m=vol_1m
             )
-        except Exception as exc:
-            self.logger.warning("[FullExit] log_full_exit_trigger failed: %s", exc)
+            if agg_plan.mode == "ALL_AT_ONCE":
+                self.logger.info(
+                    "[FullExit] aggregate override → both sides ALL_AT_ONCE (reason=%s)",
+                    agg_plan.reason,
+                )
+                self._market_exit_all_at_once("LONG", long_qty, price, tag="FULL_EXIT")
+                self._market_exit_all_at_once("SHORT", short_qty, price, tag="FULL_EXIT")
+                return
 
-        if long_qty > 0.0:
+            futures = [
+                self._exec.submit(
+                    self._execute_sliced_market_exit, "LONG", long_qty, price, "FULL_EXIT", feed
+                ),
+                self._exec.submit(
+                    self._execute_sliced_market_exit, "SHORT", short_qty, price, "FULL_EXIT", feed
+                ),
+            ]
+            for fut in futures:
+                try:
+                    fut.result()
+                except Exception as exc:
+                    self.logger.error("[FullExit] sliced exit leg failed: %s", exc)
+        elif long_qty > 0.0:
             self._execute_sliced_market_exit("LONG", long_qty, price, tag="FULL_EXIT", feed=feed)
-        if short_qty > 0.0:
+        elif short_qty > 0.0:
             self._execute_sliced_market_exit("SHORT", short_qty, price, tag="FULL_EXIT", feed=feed)
 
-    def _execute_sliced_market_exit(
+    def _safe_audit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """감사 로그 콜백을 백그라운드에서 안전하게 실행 (실패는 경고로만)."""
+        try:
+            fn(*args, **kwargs)
+        except Exception as exc:
+            self.logger.warning("[FullExit] %s failed: %s", getattr(fn, "__name__", "audit"), exc)
+
+    def _market_exit_all_at_once(self, logical_side: str, qty: float, price: float, tag: str) -> None:
+        """합산 override 확정 후 한쪽 포지션을 단일 MARKET 주문으로 청산."""
+        if qty <= 0.0:
+            return
+        side_code = self._side_code_for_exit(logical_side)
+        if not side_code:
+            return
+        try:
+            oid = self.exchange.place_market_order(side_code, qty, price_for_calc=price)
+            self.logger.info(
+                "[SliceExit] %s MARKET(all-at-once) side=%s side_code=%s qty=%.6f oid=%s",
+                tag, logical_side, side_code, qty, oid,
+            )
+        except Exception as exc:
+            self.logger.error(
+                "[SliceExit] %s MARKET(all-at-once) failed side=%s side_code=%s qty=%.6f err=%s",
+                tag, logical_side, side_code, qty, exc,
+            )
+
+    def _execute_sliced_market(
         self,
         logical_side: str,
         total_qty: float,
         price: float,
         tag: str,
         feed: Optional[StrategyFeed] = None,
+        *,
+        side_fn: Callable[["OrderManager", str], int],
+        market_cb: Callable[..., None],
+        label: str,
     ) -> None:
+        """
+        슬라이스 MARKET 실행 공통 본체.
+
+        청산/진입 변형은 아래 partialmethod 바인딩(_execute_sliced_market_exit /
+        _execute_sliced_market_entry)으로 생성 — side_code 해석 함수·콜백·로그
+        라벨만 다르고 로직은 동일하므로 본체를 하나만 유지한다.
+        """
         if total_qty <= 0.0 or price <= 0.0:
             return
 
@@ -629,34 +1317,50 @@ class OrderManager:
         if total_notional <= 0.0:
             return
 
-        vol_1s = float(getattr(feed, "vol_1s", 0.0) or 0.0) if feed is not None else 0.0
-        vol_1m = float(getattr(feed, "vol_1m", 0.0) or 0.0) if feed is not None else 0.0
+        # side_code 는 슬라이스 간 불변 — 콜백 호출마다 재계산하지 않도록 선계산
+        side_code = side_fn(self, logical_side)
+        if not side_code:
+            return
+
+        # 임계값 이하(HEDGE_EXIT 등 소액 케이스)는 vol 조회/헤더 로그/슬라이서
+        # plan 구성 없이 단일 MARKET (이 구간에서는 어떤 plan 이든 슬라이스 1개)
+        if total_notional <= MAX_SLICE_NOTIONAL:
+            market_cb(self, logical_side, total_qty, tag=tag, price=price, side_code=side_code)
+            self.logger.info("%s %s completed mode=%s slices=%d reason=%s", label, tag, "ALL_AT_ONCE", 1, "below_or_equal_threshold_all_at_once")
+            return
+
+        vol_1s, vol_1m = _feed_vols(feed)
 
         self.logger.info(
-            "[SliceExit] %s side=%s total_qty=%.6f total_notional=%.2f vol_1s=%.4f vol_1m=%.4f",
-            tag, logical_side, total_qty, total_notional, vol_1s, vol_1m,
+            "%s %s side=%s total_qty=%.6f total_notional=%.2f vol_1s=%.4f vol_1m=%.4f",
+            label, tag, logical_side, total_qty, total_notional, vol_1s, vol_1m,
         )
 
-        def _market_cb(side_str: str, qty: float) -> None:
-            if qty <= 0.0:
-                return
-            side_code = self._side_code_for_exit(side_str)
-            try:
-                oid = self.exchange.place_market_order(side_code, qty, price_for_calc=price)
-                self.logger.info("[SliceExit] %s MARKET side=%s side_code=%s qty=%.6f oid=%s", tag, side_str, side_code, qty, oid)
-            except Exception as exc:
-                self.logger.error("[SliceExit] %s MARKET failed side=%s side_code=%s qty=%.6f err=%s", tag, side_str, side_code, qty, exc)
-
         plan = self.liquidation_slicer.execute_sliced_liquidation(
             side=logical_side,
             total_notional=total_notional,
             price=price,
             vol_1s=vol_1s,
             vol_1m=vol_1m,
-            place_market_order=_market_cb,
+            place_market_order=functools.partial(market_cb, self, tag=tag, price=price, side_code=side_code),
         )
 
-        self.logger.info("[SliceExit] %s completed mode=%s slices=%d reason=%s", tag, plan.mode, len(plan.slices), plan.reason)
+        self.logger.info("%s %s completed mode=%s slices=%d reason=%s", label, tag, plan.mode, len(plan.slices), plan.reason)
+
+    def _market_cb_exit(self, side_str: str, qty: float, *, tag: str, price: float, side_code: int = 0) -> None:
+        """슬라이서 → MARKET 청산 콜백 (functools.partial 로 tag/price/side_code 바인딩)."""
+        if qty <= 0.0:
+            return
+        if not side_code:
+            side_code = self._side_code_for_exit(side_str)
+            if not side_code:
+                return
+        try:
+            oid = self.exchange.place_market_order(side_code, qty, price_for_calc=price)
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(_LOG_SLICE_EXIT, tag, side_str, side_code, qty, oid)
+        except Exception as exc:
+            self.logger.error(_LOG_SLICE_EXIT_FAIL, tag, side_str, side_code, qty, exc)
 
     def _execute_hedge_entry(self, logical_side: str, total_qty: float, feed: StrategyFeed, tag: str) -> None:
         price = float(getattr(feed, "price", 0.0) or 0.0)
@@ -664,6 +1368,8 @@ class OrderManager:
             return
 
         side_code = self._side_code_for_entry(logical_side)
+        if not side_code:
+            return
 
         self.logger.info("[HedgeEntry] %s LIMIT side=%s side_code=%s qty=%.6f price=%.2f", tag, logical_side, side_code, total_qty, price)
 
@@ -678,13 +1384,24 @@ class OrderManager:
             return
 
         # 최대 1초 대기 후 잔량 확인
+        # - WS order-update(notify_order_update)가 오면 1초를 다 기다리지 않고 즉시 진행
+        # - WS 체결 정보가 없으면 기존대로 REST get_order_status fallback
+        evt = self._order_events.setdefault(oid, threading.Event())
         try:
-            time.sleep(1.0)
-            status = self.exchange.get_order_status(oid)
-            filled = float(status.get("dealVol", 0.0) or 0.0)
-        except Exception as exc:
-            self.logger.error("[HedgeEntry] %s get_order_status failed oid=%s err=%s", tag, oid, exc)
-            filled = 0.0
+            evt.wait(timeout=1.0)
+        finally:
+            self._order_events.pop(oid, None)
+
+        filled_ws = self._fill_state.pop(oid, None)
+        if filled_ws is not None:
+            filled = float(filled_ws)
+        else:
+            try:
+                status = self.exchange.get_order_status(oid)
+                filled = float(status.get("dealVol", 0.0) or 0.0)
+            except Exception as exc:
+                self.logger.error("[HedgeEntry] %s get_order_status failed oid=%s err=%s", tag, oid, exc)
+                filled = 0.0
 
         remain = max(total_qty - filled, 0.0)
 
@@ -706,49 +1423,28 @@ class OrderManager:
                 feed=feed,
             )
 
-    def _execute_sliced_market_entry(
-        self,
-        logical_side: str,
-        total_qty: float,
-        price: float,
-        tag: str,
-        feed: Optional[StrategyFeed] = None,
-    ) -> None:
-        if total_qty <= 0.0 or price <= 0.0:
-            return
-
-        total_notional = abs(total_qty) * price
-        if total_notional <= 0.0:
+    def _market_cb_entry(self, side_str: str, qty: float, *, tag: str, price: float, side_code: int = 0) -> None:
+        """슬라이서 → MARKET 진입 콜백 (functools.partial 로 tag/price/side_code 바인딩)."""
+        if qty <= 0.0:
             return
-
-        vol_1s = float(getattr(feed, "vol_1s", 0.0) or 0.0) if feed is not None else 0.0
-        vol_1m = float(getattr(feed, "vol_1m", 0.0) or 0.0) if feed is not None else 0.0
-
-        self.logger.info(
-            "[SliceEntry] %s side=%s total_qty=%.6f total_notional=%.2f vol_1s=%.4f vol_1m=%.4f",
-            tag, logical_side, total_qty, total_notional, vol_1s, vol_1m,
-        )
-
-        def _market_cb(side_str: str, qty: float) -> None:
-            if qty <= 0.0:
-                return
+        if not side_code:
             side_code = self._side_code_for_entry(side_str)
-            try:
-                oid = self.exchange.place_market_order(side_code, qty, price_for_calc=price)
-                self.logger.info("[SliceEntry] %s MARKET side=%s side_code=%s qty=%.6f oid=%s", tag, side_str, side_code, qty, oid)
-            except Exception as exc:
-                self.logger.error("[SliceEntry] %s MARKET failed side=%s side_code=%s qty=%.6f err=%s", tag, side_str, side_code, qty, exc)
-
-        plan = self.liquidation_slicer.execute_sliced_liquidation(
-            side=logical_side,
-            total_notional=total_notional,
-            price=price,
-            vol_1s=vol_1s,
-            vol_1m=vol_1m,
-            place_market_order=_market_cb,
-        )
+            if not side_code:
+                return
+        try:
+            oid = self.exchange.place_market_order(side_code, qty, price_for_calc=price)
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(_LOG_SLICE_ENTRY, tag, side_str, side_code, qty, oid)
+        except Exception as exc:
+            self.logger.error(_LOG_SLICE_ENTRY_FAIL, tag, side_str, side_code, qty, exc)
 
-        self.logger.info("[SliceEntry] %s completed mode=%s slices=%d reason=%s", tag, plan.mode, len(plan.slices), plan.reason)
+    # 청산/진입 변형 바인딩 — 본체(_execute_sliced_market)는 하나만 유지
+    _execute_sliced_market_exit = functools.partialmethod(
+        _execute_sliced_market, side_fn=_side_code_for_exit, market_cb=_market_cb_exit, label="[SliceExit]"
+    )
+    _execute_sliced_market_entry = functools.partialmethod(
+        _execute_sliced_market, side_fn=_side_code_for_entry, market_cb=_market_cb_entry, label="[SliceEntry]"
+    )
 
     # ==========================================================
     # Legacy (optional): atomic order (호환용)
@@ -773,19 +1469,40 @@ class OrderManager:
         if qty <= 0.0:
             return {"limit_oid": None, "market_oid": None, "filled": 0.0}
 
-        limit_oid = self.exchange.place_limit_order(side, price, qty)
+        # REST/대기는 전부 공용 om-io 풀로 라우팅:
+        # - 이벤트 루프 스레드를 블로킹 REST 로 막지 않는다
+        # - asyncio.to_thread 의 기본 풀(min(32, cpu+4)) 대신 상한 8 의 전용 풀 사용
+        loop = asyncio.get_running_loop()
+
+        limit_oid = await loop.run_in_executor(
+            self._exec, self.exchange.place_limit_order, side, price, qty
+        )
         filled = 0.0
 
-        t0 = time.time()
-        while time.time() - t0 < float(timeout or 0.0):
-            await asyncio.sleep(0.2)
-            st = self.exchange.get_order_status(limit_oid)
-            filled = float(st.get("dealVol", 0.0) or 0.0)
-            if filled >= qty:
-                return {"limit_oid": limit_oid, "market_oid": None, "filled": filled}
+        # 0.2초 REST 폴링 대신 WS order-update 이벤트 대기
+        # (notify_order_update 가 체결 완료 시 이벤트를 set → 체결 즉시 반환)
+        evt = self._order_events.setdefault(limit_oid, threading.Event())
+        try:
+            await loop.run_in_executor(self._exec, evt.wait, float(timeout or 0.0))
+        finally:
+            self._order_events.pop(limit_oid, None)
+
+        filled_ws = self._fill_state.pop(limit_oid, None)
+        if filled_ws is not None:
+            filled = float(filled_ws)
+        else:
+            # WS 데이터가 없으면 단 1회 REST 확인
+            try:
+                st = await loop.run_in_executor(self._exec, self.exchange.get_order_status, limit_oid)
+                filled = float(st.get("dealVol", 0.0) or 0.0)
+            except Exception:
+                filled = 0.0
+
+        if filled >= qty:
+            return {"limit_oid": limit_oid, "market_oid": None, "filled": filled}
 
         try:
-            self.exchange.cancel_order(limit_oid)
+            await loop.run_in_executor(self._exec, self.exchange.cancel_order, limit_oid)
         except Exception:
             pass
 
@@ -793,7 +1510,10 @@ class OrderManager:
         if (not allow_taker) or remain <= 0.0:
             return {"limit_oid": limit_oid, "market_oid": None, "filled": filled}
 
-        market_oid = self.exchange.place_market_order(side, remain, price_for_calc=price)
+        market_oid = await loop.run_in_executor(
+            self._exec,
+            functools.partial(self.exchange.place_market_order, side, remain, price_for_calc=price),
+        )
         return {"limit_oid": limit_oid, "market_oid": market_oid, "filled": qty}
 
 
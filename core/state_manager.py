@@ -1,13 +1,127 @@
 from __future__ import annotations
 
+import atexit
 import json
+import mmap
 import os
-from typing import Any, Dict, Optional
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
+from typing import Any, ClassVar, Dict, Optional
+
+# C 가속 JSON (선택 의존성) — 없으면 stdlib json 으로 동작
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 바이너리 영속 포맷 (선택 의존성) — 있으면 msgpack 으로 저장 (~50% 작은 페이로드)
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 
 from config import STATE_FILE_PATH
 from utils.logger import logger
 from strategy.state_model import BotState, LineState
 
+# 저장 debounce 정책:
+# - 라인 FSM 전환처럼 버스트로 들어오는 변경은 dirty 표시만 하고,
+#   주기/누적 횟수 조건을 만족할 때만 실제 파일 쓰기로 합쳐서 처리한다.
+_FLUSH_INTERVAL_SEC = 0.5  # 백그라운드 flusher 주기 + 시간 기준 즉시 flush 임계
+_FLUSH_DIRTY_MAX = 20      # dirty 누적 횟수가 이 값 이상이면 즉시 flush
+
+# line_memory 전용 WAL (append-only 사이드카):
+# - FSM 전환 1건 = 6 bytes 레코드 (side_code:B, grid_index:i, state_code:B)
+#   ※ grid_index 는 음수 가능 → signed "i" 사용
+# - 스냅샷 재작성(compact)은 wave reset 경계에서만 수행
+_WAL_RECORD = struct.Struct("<BiB")
+_WAL_FSYNC_EVERY = 32  # 레코드 K건마다 fsync
+
+_WAL_STATE_CODE = {
+    LineState.FREE: 0,
+    LineState.OPEN: 1,
+    LineState.LOCKED_LOSS: 2,
+}
+_WAL_STATE_BY_CODE = {v: k for k, v in _WAL_STATE_CODE.items()}
+
+# LineState 값 문자열 → 멤버 직조회 테이블 (enum 생성자의 예외 경로 회피)
+_LINE_STATE_BY_VALUE = {s.value: s for s in LineState}
+
+# 역직렬화용 필드 → 타입 보정 함수 dispatch 테이블.
+# (line_memory_* 는 전용 변환이 필요해 테이블에 넣지 않고 별도 처리)
+_FIELD_COERCERS: Dict[str, Any] = {
+    "mode": str,
+    "wave_id": int,
+    "p_center": float,
+    "p_gap": float,
+    "atr_value": float,
+    "long_seed_total_effective": float,
+    "short_seed_total_effective": float,
+    "unit_seed_long": float,
+    "unit_seed_short": float,
+    "k_long": int,
+    "k_short": int,
+    "startup_done": bool,
+    "long_size": float,
+    "short_size": float,
+    "long_pnl": float,
+    "short_pnl": float,
+    "long_pos_nonzero": bool,
+    "short_pos_nonzero": bool,
+    "long_pnl_sign": int,
+    "short_pnl_sign": int,
+    "long_steps_filled": int,
+    "short_steps_filled": int,
+    "news_block": bool,
+    "cb_block": bool,
+}
+
+class Side(IntEnum):
+    """
+    line_memory API 용 방향 코드.
+    - 기존 "LONG"/"SHORT" 문자열 대신 전달 가능 (핫 루프에서 str 처리 생략)
+    - 값은 내부 _mem_refs 튜플의 slot 인덱스와 일치
+    """
+    LONG = 0
+    SHORT = 1
+
+
+# 흔한 side 표기 → slot 직조회 (upper() 신규 문자열 할당 회피, state_model 의
+# _TOKEN_INTERN 과 같은 패턴)
+_SIDE_SLOT = {
+    "LONG": 0, "long": 0, "Long": 0,
+    "SHORT": 1, "short": 1, "Short": 1,
+}
+_SIDE_NAME = ("LONG", "SHORT")
+
+
+def _side_slot(side: Any) -> int:
+    """side ("LONG"/"SHORT" 또는 Side/0·1) → 내부 slot 인덱스."""
+    if type(side) is str:
+        slot = _SIDE_SLOT.get(side)
+        if slot is None:
+            slot = _SIDE_SLOT.get(side.upper())
+    elif isinstance(side, int) and 0 <= side <= 1:
+        slot = int(side)
+    else:
+        slot = None
+    if slot is None:
+        raise ValueError(f"invalid side for line memory: {side!r}")
+    return slot
+
+
+# v9 → v10 호환 별칭 테이블: (신형 키, 구형 키).
+# 신형 키가 없을 때만 구형 키 값을 신형 키로 재매핑한다.
+_V9_ALIASES = (
+    ("long_seed_total_effective", "long_seed_total"),
+    ("short_seed_total_effective", "short_seed_total"),
+    ("unit_seed_long", "unit_seed"),
+    ("unit_seed_short", "unit_seed"),
+)
+
 
 class StateManager:
     """
@@ -19,9 +133,102 @@ class StateManager:
     - LineMemory FSM (FREE/OPEN/LOCKED_LOSS) 업데이트 엔트리 포인트 제공
     """
 
+    # 직렬화 스키마의 필수 키 (v10.1) — 역직렬화 호출마다 set 을 새로 만들지 않도록
+    # 클래스 레벨 frozenset 으로 고정
+    _REQUIRED_KEYS: ClassVar[frozenset] = frozenset({
+        "mode",
+        "wave_id",
+        "p_center",
+        "p_gap",
+        "atr_value",
+        "long_seed_total_effective",
+        "short_seed_total_effective",
+        "unit_seed_long",
+        "unit_seed_short",
+        "k_long",
+        "k_short",
+        "startup_done",
+        "long_size",
+        "short_size",
+        "long_pnl",
+        "short_pnl",
+        "long_pos_nonzero",
+        "short_pos_nonzero",
+        "long_pnl_sign",
+        "short_pnl_sign",
+        "long_steps_filled",
+        "short_steps_filled",
+        "news_block",
+        "cb_block",
+        "line_memory_long",
+        "line_memory_short",
+    })
+
+    # 직렬화 대상 스칼라 필드 (한 번만 계산해 캐시).
+    # ※ state.__dict__ 복사를 쓰지 않는 이유: BotState 의 TP 런타임 필드
+    #   (long_tp_active 등)는 영속 대상이 아니고, slots 적용 시 __dict__ 가 없다.
+    _PLAIN_FIELDS: ClassVar[tuple] = tuple(
+        sorted(_REQUIRED_KEYS - {"line_memory_long", "line_memory_short"})
+    )
+
     def __init__(self, state_file_path: str = STATE_FILE_PATH) -> None:
         self.state_file_path = state_file_path
-        self.state: BotState = self._load_state()
+        # msgpack 사용 시의 바이너리 스냅샷 경로 (JSON 경로와 나란히 둔다)
+        self.msgpack_file_path = os.path.splitext(state_file_path)[0] + ".msgpack"
+
+        # line_memory 델타용 WAL (지연 오픈; _load_state 의 replay 보다 먼저 준비)
+        self.wal_file_path = f"{state_file_path}.wal"
+        self._wal = None
+        self._wal_records = 0
+
+        # BotState 는 첫 접근 시 lazy load (state property 참조)
+        # → 타입 참조 목적의 import 만으로는 파일 I/O/파싱 비용을 내지 않는다.
+        self._state: Optional[BotState] = None
+
+        # (line_memory_long, line_memory_short) 참조 캐시 — state 교체 시 무효화
+        self._mem_refs = None
+
+        # 저장 debounce 상태 (save_state 참조)
+        self._save_lock = threading.Lock()
+        self._dirty = False
+        self._dirty_count = 0
+        self._last_flush_ts = time.monotonic()
+
+        # 마지막으로 기록한 payload bytes — 내용이 같으면 no-op 쓰기 생략
+        # (hash 비교는 충돌 시 쓰기를 조용히 버릴 수 있어 bytes 동등 비교 사용;
+        #  payload 는 수백 바이트라 비교 비용은 해시와 동급)
+        self._last_payload: Optional[bytes] = None
+
+        # 스냅샷 쓰기 전용 단일 워커 — 틱 경로에서 디스크 I/O 대기 제거.
+        # pending 플래그로 제출을 1건으로 합친다 (워커가 최신 상태를 기록).
+        self._io_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix="state-io")
+        self._flush_pending = False
+
+        # dirty 상태를 주기적으로 파일에 내려주는 백그라운드 flusher
+        flusher = threading.Thread(
+            target=self._flush_loop, name="state-flush", daemon=True
+        )
+        flusher.start()
+
+        # 프로세스 종료 시 남은 dirty 상태를 마지막으로 반영
+        atexit.register(self.flush)
+
+    @property
+    def state(self) -> BotState:
+        """
+        현재 BotState (첫 접근 시 파일에서 lazy load).
+        """
+        s = self._state
+        if s is None:
+            s = self._load_state()
+            self._state = s
+        return s
+
+    @state.setter
+    def state(self, value: Any) -> None:
+        # 테스트/브리지 코드에서 dict 등으로 교체하는 패턴 허용
+        self._state = value
+        self._mem_refs = None
 
     # ==================================================================
     # 내부 유틸: 기본 BotState / 직렬화 & 역직렬화
@@ -60,13 +267,24 @@ class StateManager:
             line_memory_short={},
         )
 
-    def _serialize_line_memory(self, mem: Dict[int, LineState]) -> Dict[str, str]:
+    def _serialize_line_memory(self, mem: Dict[int, LineState]) -> Dict[str, Any]:
         """
-        line_memory_* : Dict[int, LineState] -> Dict[str, str] (JSON 저장용)
-        - key: grid_index (int) -> str
-        - value: LineState.value ("FREE" / "OPEN" / "LOCKED_LOSS")
+        line_memory_* : Dict[int, LineState] -> SoA 형태 (저장용)
+
+        상태별 grid_index 정수 리스트 2개로 직렬화한다 (FREE 는 부재 = 저장 안 함):
+        - {"open": [idx, ...], "locked": [idx, ...]}
+        구버전의 {"idx": "OPEN"} dict 형태보다 작고, 인덱스당 str 변환이 없다.
         """
-        return {str(idx): state.value for idx, state in mem.items()}
+        open_idx = []
+        locked_idx = []
+        for idx, state in mem.items():
+            if state is LineState.OPEN:
+                open_idx.append(idx)
+            elif state is LineState.LOCKED_LOSS:
+                locked_idx.append(idx)
+        open_idx.sort()
+        locked_idx.sort()
+        return {"open": open_idx, "locked": locked_idx}
 
     def _deserialize_line_memory(self, raw: Any) -> Dict[int, LineState]:
         """
@@ -77,51 +295,57 @@ class StateManager:
         if not isinstance(raw, dict):
             return result
 
+        # 신형 SoA 형태: {"open": [idx, ...], "locked": [idx, ...]}
+        if isinstance(raw.get("open"), list) or isinstance(raw.get("locked"), list):
+            for idx in raw.get("open") or ():
+                try:
+                    result[int(idx)] = LineState.OPEN
+                except (TypeError, ValueError):
+                    continue
+            for idx in raw.get("locked") or ():
+                try:
+                    result[int(idx)] = LineState.LOCKED_LOSS
+                except (TypeError, ValueError):
+                    continue
+            return result
+
+        # 구버전 형태: {"idx": "OPEN"/"LOCKED_LOSS"/...}
+        by_value = _LINE_STATE_BY_VALUE
         for k, v in raw.items():
-            try:
-                idx = int(k)
-            except (TypeError, ValueError):
-                continue
-            try:
-                state = LineState(v)
-            except ValueError:
+            state = by_value.get(v)
+            if state is None:
                 # 알 수 없는 값은 무시 (FREE 취급)
                 continue
+            # 정수 키 fast path — JSON 키는 "−12"~"12" 같은 숫자 문자열
+            if type(k) is int:
+                idx = k
+            elif type(k) is str and k.lstrip("-").isdigit():
+                idx = int(k)
+            else:
+                try:
+                    idx = int(k)
+                except (TypeError, ValueError):
+                    continue
             result[idx] = state
         return result
 
+    # import 시점에 _PLAIN_FIELDS 로부터 codegen 으로 채워진다 (모듈 하단 참조)
+    _fast_serialize: ClassVar[Optional[Any]] = None
+
     def _serialize_bot_state(self, state: BotState) -> Dict[str, Any]:
         """
-        BotState → JSON 직렬화용 dict (필드 1:1 매핑).
-        """
-        return {
-            "mode": state.mode,
-            "wave_id": state.wave_id,
-            "p_center": state.p_center,
-            "p_gap": state.p_gap,
-            "atr_value": state.atr_value,
-            "long_seed_total_effective": state.long_seed_total_effective,
-            "short_seed_total_effective": state.short_seed_total_effective,
-            "unit_seed_long": state.unit_seed_long,
-            "unit_seed_short": state.unit_seed_short,
-            "k_long": state.k_long,
-            "k_short": state.k_short,
-            "startup_done": state.startup_done,
-            "long_size": state.long_size,
-            "short_size": state.short_size,
-            "long_pnl": state.long_pnl,
-            "short_pnl": state.short_pnl,
-            "long_pos_nonzero": state.long_pos_nonzero,
-            "short_pos_nonzero": state.short_pos_nonzero,
-            "long_pnl_sign": state.long_pnl_sign,
-            "short_pnl_sign": state.short_pnl_sign,
-            "long_steps_filled": state.long_steps_filled,
-            "short_steps_filled": state.short_steps_filled,
-            "news_block": state.news_block,
-            "cb_block": state.cb_block,
-            "line_memory_long": self._serialize_line_memory(state.line_memory_long),
-            "line_memory_short": self._serialize_line_memory(state.line_memory_short),
-        }
+        BotState → 직렬화용 dict.
+        - 일반 경로: _PLAIN_FIELDS 에서 생성한 codegen 함수 (dict 리터럴 1개)
+        - codegen 실패 시: 캐시된 필드 튜플 순회로 폴백
+        """
+        fast = self._fast_serialize
+        if fast is not None:
+            return fast(state, self._serialize_line_memory)
+
+        out = {name: getattr(state, name) for name in self._PLAIN_FIELDS}
+        out["line_memory_long"] = self._serialize_line_memory(state.line_memory_long)
+        out["line_memory_short"] = self._serialize_line_memory(state.line_memory_short)
+        return out
 
     def _deserialize_bot_state(self, data: Dict[str, Any]) -> BotState:
         """
@@ -130,42 +354,13 @@ class StateManager:
         - 필수 키 세트가 아니거나, 예상치 못한 키가 있으면 경고 로그를 남기고
           가능한 한 호환 모드로 로드한다.
         """
-        required_keys = {
-            "mode",
-            "wave_id",
-            "p_center",
-            "p_gap",
-            "atr_value",
-            "long_seed_total_effective",
-            "short_seed_total_effective",
-            "unit_seed_long",
-            "unit_seed_short",
-            "k_long",
-            "k_short",
-            "startup_done",
-            "long_size",
-            "short_size",
-            "long_pnl",
-            "short_pnl",
-            "long_pos_nonzero",
-            "short_pos_nonzero",
-            "long_pnl_sign",
-            "short_pnl_sign",
-            "long_steps_filled",
-            "short_steps_filled",
-            "news_block",
-            "cb_block",
-            "line_memory_long",
-            "line_memory_short",
-        }
-
         if not isinstance(data, dict):
             logger.warning("BotState JSON 형식이 dict가 아님 → 기본 상태로 복구")
             return self._default_bot_state()
 
-        keys = set(data.keys())
-        missing = required_keys - keys
-        extra = keys - required_keys
+        # dict keys view 와 frozenset 의 차집합 — 중간 set(data.keys()) 생성 없음
+        missing = self._REQUIRED_KEYS.difference(data)
+        extra = data.keys() - self._REQUIRED_KEYS
 
         if missing or extra:
             logger.warning(
@@ -175,108 +370,34 @@ class StateManager:
             )
 
         try:
-            # 기본값은 항상 최신 스키마의 기본 상태에서 가져온다.
-            default = self._default_bot_state()
-
-            mode = str(data.get("mode", default.mode))
-            wave_id = int(data.get("wave_id", default.wave_id))
-            p_center = float(data.get("p_center", default.p_center))
-            p_gap = float(data.get("p_gap", default.p_gap))
-            atr_value = float(data.get("atr_value", default.atr_value))
-
-            # v9 → v10 호환: *_effective 없으면 예전 long_seed_total / short_seed_total 사용
-            long_seed_total_effective = float(
-                data.get(
-                    "long_seed_total_effective",
-                    data.get("long_seed_total", default.long_seed_total_effective),
-                )
-            )
-            short_seed_total_effective = float(
-                data.get(
-                    "short_seed_total_effective",
-                    data.get("short_seed_total", default.short_seed_total_effective),
-                )
-            )
-
-            # v9 → v10 호환: unit_seed_long/unit_seed_short 없으면 예전 unit_seed 사용
-            unit_seed_long = float(
-                data.get(
-                    "unit_seed_long",
-                    data.get("unit_seed", default.unit_seed_long),
-                )
-            )
-            unit_seed_short = float(
-                data.get(
-                    "unit_seed_short",
-                    data.get("unit_seed", default.unit_seed_short),
-                )
-            )
-
-            k_long = int(data.get("k_long", default.k_long))
-            k_short = int(data.get("k_short", default.k_short))
-
-            startup_done = bool(data.get("startup_done", default.startup_done))
-
-            long_size = float(data.get("long_size", default.long_size))
-            short_size = float(data.get("short_size", default.short_size))
-            long_pnl = float(data.get("long_pnl", default.long_pnl))
-            short_pnl = float(data.get("short_pnl", default.short_pnl))
-
-            long_pos_nonzero = bool(
-                data.get("long_pos_nonzero", default.long_pos_nonzero)
+            # v9 → v10 호환 pre-pass: 구형 키를 신형 키로 재매핑.
+            # (원본 dict 는 건드리지 않고, 별칭이 실제로 있을 때만 1회 복사)
+            remapped = None
+            for new_key, old_key in _V9_ALIASES:
+                if new_key not in data and old_key in data:
+                    if remapped is None:
+                        remapped = dict(data)
+                    remapped[new_key] = data[old_key]
+            if remapped is not None:
+                data = remapped
+
+            # 기본 상태에서 시작해 data 를 한 번만 순회하며 덮어쓴다.
+            # (필드별 data.get() 체인 대비 dict 조회 횟수 절반 이하;
+            #  기본값은 _default_bot_state() 가 제공하므로 테이블에 중복 안 둠)
+            result = self._default_bot_state()
+            coercers = _FIELD_COERCERS
+            for k, v in data.items():
+                coerce = coercers.get(k)
+                if coerce is not None:
+                    setattr(result, k, coerce(v))
+
+            result.line_memory_long = self._deserialize_line_memory(
+                data.get("line_memory_long")
             )
-            short_pos_nonzero = bool(
-                data.get("short_pos_nonzero", default.short_pos_nonzero)
-            )
-
-            long_pnl_sign = int(data.get("long_pnl_sign", default.long_pnl_sign))
-            short_pnl_sign = int(data.get("short_pnl_sign", default.short_pnl_sign))
-
-            long_steps_filled = int(
-                data.get("long_steps_filled", default.long_steps_filled)
-            )
-            short_steps_filled = int(
-                data.get("short_steps_filled", default.short_steps_filled)
-            )
-
-            news_block = bool(data.get("news_block", default.news_block))
-            cb_block = bool(data.get("cb_block", default.cb_block))
-
-            line_memory_long = self._deserialize_line_memory(
-                data.get("line_memory_long", default.line_memory_long)
-            )
-            line_memory_short = self._deserialize_line_memory(
-                data.get("line_memory_short", default.line_memory_short)
-            )
-
-            return BotState(
-                mode=mode,
-                wave_id=wave_id,
-                p_center=p_center,
-                p_gap=p_gap,
-                atr_value=atr_value,
-                long_seed_total_effective=long_seed_total_effective,
-                short_seed_total_effective=short_seed_total_effective,
-                unit_seed_long=unit_seed_long,
-                unit_seed_short=unit_seed_short,
-                k_long=k_long,
-                k_short=k_short,
-                startup_done=startup_done,
-                long_size=long_size,
-                short_size=short_size,
-                long_pnl=long_pnl,
-                short_pnl=short_pnl,
-                long_pos_nonzero=long_pos_nonzero,
-                short_pos_nonzero=short_pos_nonzero,
-                long_pnl_sign=long_pnl_sign,
-                short_pnl_sign=short_pnl_sign,
-                long_steps_filled=long_steps_filled,
-                short_steps_filled=short_steps_filled,
-                news_block=news_block,
-                cb_block=cb_block,
-                line_memory_long=line_memory_long,
-                line_memory_short=line_memory_short,
+            result.line_memory_short = self._deserialize_line_memory(
+                data.get("line_memory_short")
             )
+            return result
         except Exception as exc:
             logger.error("BotState 역직렬화 실패 → 기본 상태로 복구: %s", exc)
             return self._default_bot_state()
@@ -285,20 +406,56 @@ class StateManager:
     # 파일 I/O: load / save (atomic)
     # ==================================================================
 
+    @staticmethod
+    def _parse_mapped(path: str, parse) -> Any:
+        """
+        파일을 mmap 으로 매핑해 복사 없이 parse(buffer) 호출.
+        - mmap 은 파싱 동안만 유지 (memoryview 는 close 전에 해제)
+        - 빈 파일은 mmap 불가 → ValueError 로 상위 except 에서 기본 상태 복구
+        """
+        with open(path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                mv = memoryview(mm)
+                try:
+                    return parse(mv)
+                finally:
+                    mv.release()
+
     def _load_state(self) -> BotState:
         """
         STATE_FILE_PATH 에서 BotState 로드.
         - 파일이 없거나 손상된 경우 기본 상태 사용.
         """
         path = self.state_file_path
-        if not os.path.exists(path):
-            logger.info("BotState 파일 없음 → 기본 상태로 시작")
-            return self._default_bot_state()
+        mp_path = self.msgpack_file_path
 
         try:
-            with open(path, "r") as f:
-                data = json.load(f)
+            use_msgpack = msgpack is not None and os.path.exists(mp_path)
+            if use_msgpack and os.path.exists(path):
+                # 두 스냅샷이 모두 있으면 더 최신(mtime) 쪽을 읽는다.
+                # (msgpack 이 한동안 빠져 JSON 만 갱신된 경우, 무조건 msgpack 을
+                #  읽으면 stale 한 wave/line-lock 상태가 되살아난다)
+                use_msgpack = os.path.getmtime(mp_path) >= os.path.getmtime(path)
+
+            if use_msgpack:
+                # msgpack 스냅샷 (mmap → 중간 bytes 복사 없이 디코드)
+                data = self._parse_mapped(mp_path, lambda mv: msgpack.unpackb(mv, raw=False))
+            elif os.path.exists(path):
+                # JSON 스냅샷 (msgpack 미설치 또는 구버전 파일 호환)
+                if orjson is not None:
+                    data = self._parse_mapped(path, orjson.loads)
+                else:
+                    # stdlib json 은 mmap 버퍼를 받지 못하므로 일반 read 사용
+                    with open(path, "rb") as f:
+                        data = json.loads(f.read())
+            else:
+                logger.info("BotState 파일 없음 → 기본 상태로 시작")
+                state = self._default_bot_state()
+                self._replay_wal(state)
+                return state
+
             state = self._deserialize_bot_state(data)
+            self._replay_wal(state)
             logger.info(
                 "BotState 로드: mode=%s wave_id=%s p_center=%s p_gap=%s",
                 state.mode,
@@ -309,15 +466,94 @@ class StateManager:
             return state
         except Exception as e:
             logger.error(f"BotState 파일 로드 실패 → 기본 상태로 복구: {e}")
-            return self._default_bot_state()
+            # 스냅샷이 깨진 crash 직후가 WAL 의 존재 이유 — 기본 상태 위에
+            # replay 해서 fsync 된 line_memory 전환(LOCKED_LOSS 등)을 살린다.
+            state = self._default_bot_state()
+            self._replay_wal(state)
+            return state
+
+    def save_state(self, force: bool = False) -> None:
+        """
+        BotState 저장 요청 (debounce).
+
+        - 기본은 dirty 표시만 하고, 시간/누적 횟수 조건을 만족할 때만
+          실제 파일 쓰기를 수행한다 (버스트 변경 → 1회 쓰기로 coalesce).
+        - force=True 는 즉시 기록 (wave reset 등 내구성이 필요한 경계).
+        """
+        self._dirty = True
+        self._dirty_count += 1
+        if force:
+            # wave 경계 등 내구성이 필요한 저장은 호출자 스레드에서 동기 수행
+            self._save_state_now(durable=True)
+        elif (
+            self._dirty_count >= _FLUSH_DIRTY_MAX
+            or (time.monotonic() - self._last_flush_ts) > _FLUSH_INTERVAL_SEC
+        ):
+            self._submit_flush()
+
+    def flush(self) -> None:
+        """
+        dirty 상태면 즉시 동기로 기록 (공개 API).
+        - 종료 hook(atexit) 및 셧다운 경로에서 호출 — fsync 포함 durable 저장.
+        """
+        if self._dirty:
+            self._save_state_now(durable=True)
+
+    def _submit_flush(self) -> None:
+        """
+        state-io 워커에 스냅샷 쓰기를 제출 (호출자는 디스크를 기다리지 않음).
+        - 이미 제출된 건이 있으면 중복 제출하지 않는다 (워커가 최신 상태 기록)
+        """
+        if self._flush_pending:
+            return
+        self._flush_pending = True
+        try:
+            self._io_exec.submit(self._flush_async)
+        except RuntimeError:
+            # interpreter 종료 중 등 executor 사용 불가 → 동기 폴백
+            self._flush_pending = False
+            self._save_state_now()
+
+    def _flush_async(self) -> None:
+        self._flush_pending = False
+        try:
+            self._save_state_now()
+        except Exception as e:
+            logger.error(f"BotState 비동기 flush 실패: {e}")
 
-    def save_state(self) -> None:
+    def _flush_loop(self) -> None:
         """
-        BotState 를 JSON으로 atomic write 방식으로 저장.
+        백그라운드 flusher: 주기적으로 dirty 상태를 state-io 워커에 넘긴다.
+        """
+        while True:
+            time.sleep(_FLUSH_INTERVAL_SEC)
+            try:
+                if self._dirty:
+                    self._submit_flush()
+            except Exception as e:
+                logger.error(f"BotState 백그라운드 flush 실패: {e}")
+
+    def _save_state_now(self, durable: bool = False) -> None:
+        """
+        BotState 를 atomic write 방식으로 저장.
         - tmp 파일 작성 후 os.replace 로 교체.
+        - durable=True 일 때만 rename 전에 fsync (wave 경계 전용).
+        """
+        with self._save_lock:
+            self._dirty = False
+            self._dirty_count = 0
+            self._last_flush_ts = time.monotonic()
+            self._write_snapshot(durable)
+
+    def _write_snapshot(self, durable: bool = False) -> None:
+        """
+        내구성 모델:
+        - 쓰기는 항상 rename-atomic (손상된 스냅샷이 보이지 않음)
+        - crash-durable 은 durable=True (wave reset/compact) 경로에서만 보장;
+          주기 flush 는 fsync 를 생략해 틱 경로에서 디스크 대기를 피한다.
         """
         data = self._serialize_bot_state(self.state)
-        path = self.state_file_path
+        path = self.msgpack_file_path if msgpack is not None else self.state_file_path
         tmp_path = f"{path}.tmp"
 
         try:
@@ -325,15 +561,35 @@ class StateManager:
             if directory:
                 os.makedirs(directory, exist_ok=True)
 
-            with open(tmp_path, "w") as f:
-                json.dump(
+            if msgpack is not None:
+                payload = msgpack.packb(data, use_bin_type=True)
+            elif orjson is not None:
+                payload = orjson.dumps(
+                    data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+                )
+            else:
+                payload = json.dumps(
                     data,
-                    f,
                     ensure_ascii=False,
                     separators=(",", ":"),
                     sort_keys=True,
-                )
+                ).encode("utf-8")
+
+            # 내용이 직전 기록과 동일하면 쓰기 자체를 생략 (no-op save).
+            # durable 요청은 fsync 보장이 목적이므로 생략하지 않는다.
+            if not durable and payload == self._last_payload:
+                return
+
+            # Python 버퍼링 없이 fd 에 직접 1회 기록
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, payload)
+                if durable:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
             os.replace(tmp_path, path)
+            self._last_payload = payload
         except Exception as e:
             logger.error(f"BotState 저장 실패: {e}")
             try:
@@ -342,6 +598,83 @@ class StateManager:
             except OSError:
                 pass
 
+    # ==================================================================
+    # line_memory WAL: append / replay / compact
+    # ==================================================================
+
+    def _wal_append(self, side_slot: int, idx: int, state: LineState) -> None:
+        """
+        line_memory FSM 전환 1건을 WAL 에 append.
+        - 전체 스냅샷 재작성 대신 6 bytes 만 기록 (쓰기 증폭 제거)
+        - 실패 시 전체 저장으로 폴백해 영속성은 유지
+        """
+        try:
+            if self._wal is None:
+                directory = os.path.dirname(self.wal_file_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._wal = open(self.wal_file_path, "ab", buffering=0)
+
+            self._wal.write(
+                _WAL_RECORD.pack(side_slot, int(idx), _WAL_STATE_CODE[state])
+            )
+            self._wal_records += 1
+            if self._wal_records % _WAL_FSYNC_EVERY == 0:
+                os.fsync(self._wal.fileno())
+        except Exception as e:
+            logger.error(f"line_memory WAL 기록 실패 → 전체 저장으로 대체: {e}")
+            self.save_state(force=True)
+
+    def _replay_wal(self, state: BotState) -> None:
+        """
+        스냅샷 로드 직후 WAL 레코드를 순서대로 재적용.
+        - 레코드는 append 순서 = 시간 순서이므로 마지막 레코드가 이긴다.
+        - 손상된 꼬리(6 bytes 미만)는 잘라내고 무시.
+        """
+        path = self.wal_file_path
+        if not os.path.exists(path):
+            return
+
+        try:
+            with open(path, "rb") as f:
+                raw = f.read()
+            usable = len(raw) - (len(raw) % _WAL_RECORD.size)
+
+            count = 0
+            for side_code, idx, state_code in _WAL_RECORD.iter_unpack(raw[:usable]):
+                mem = (
+                    state.line_memory_long
+                    if side_code == 0
+                    else state.line_memory_short
+                )
+                line_state = _WAL_STATE_BY_CODE.get(state_code)
+                if line_state is None or line_state is LineState.FREE:
+                    mem.pop(idx, None)
+                else:
+                    mem[idx] = line_state
+                count += 1
+
+            if count:
+                logger.info("line_memory WAL replay: %s records", count)
+        except Exception as e:
+            logger.error(f"line_memory WAL replay 실패 (무시): {e}")
+
+    def compact(self) -> None:
+        """
+        전체 스냅샷 재작성 + WAL truncate.
+        - wave reset 경계에서 호출 (line_memory 가 FREE 초기화되는 시점)
+        """
+        self.save_state(force=True)
+        try:
+            if self._wal is not None:
+                self._wal.close()
+                self._wal = None
+            self._wal_records = 0
+            if os.path.exists(self.wal_file_path):
+                os.truncate(self.wal_file_path, 0)
+        except OSError as e:
+            logger.error(f"line_memory WAL compact 실패: {e}")
+
     # ==================================================================
     # 외부 접근용: BotState 조회/수정 helper
     # ==================================================================
@@ -360,8 +693,6 @@ class StateManager:
         return getattr(self.state, key, default)
 
     def update(self, key: str, value: Any) -> None:
-        if hasattr(self, "logger") and self.logger is not None:
-            self.logger.info("[StateManager] update: %s = %s", key, value)
         """
         (레거시 호환용) 단일 BotState 필드 업데이트 후 저장.
         - 존재하지 않는 키는 무시하고 경고만 로그.
@@ -400,38 +731,45 @@ class StateManager:
         - line_memory_long / line_memory_short 는 FREE 초기화
           (dict 비우기 → 어떤 index 도 LOCKED_LOSS/OPEN 이 아님을 보장)
         """
-        new_wave_id = self.state.wave_id + 1
-
-        self.state = BotState(
-            mode=mode,
-            wave_id=new_wave_id,
-            p_center=float(p_center),
-            p_gap=float(p_gap),
-            atr_value=float(atr_value),
-            long_seed_total_effective=float(long_seed_total_effective),
-            short_seed_total_effective=float(short_seed_total_effective),
-            unit_seed_long=float(unit_seed_long),
-            unit_seed_short=float(unit_seed_short),
-            k_long=0,
-            k_short=0,
-            startup_done=False,
-            long_size=0.0,
-            short_size=0.0,
-            long_pnl=0.0,
-            short_pnl=0.0,
-            long_pos_nonzero=False,
-            short_pos_nonzero=False,
-            long_pnl_sign=0,
-            short_pnl_sign=0,
-            long_steps_filled=0,
-            short_steps_filled=0,
-            news_block=False,
-            cb_block=False,
-            line_memory_long={},
-            line_memory_short={},
-        )
-
-        self.save_state()
+        # 새 BotState 할당 대신 in-place 초기화.
+        # - 외부에서 잡고 있는 self.state / line_memory 참조가 그대로 유효
+        # - _mem_refs 캐시도 무효화 불필요 (dict 는 clear 만 수행)
+        s = self.state
+        s.wave_id += 1
+        s.mode = mode
+        s.p_center = float(p_center)
+        s.p_gap = float(p_gap)
+        s.atr_value = float(atr_value)
+        s.long_seed_total_effective = float(long_seed_total_effective)
+        s.short_seed_total_effective = float(short_seed_total_effective)
+        s.unit_seed_long = float(unit_seed_long)
+        s.unit_seed_short = float(unit_seed_short)
+        s.k_long = 0
+        s.k_short = 0
+        s.startup_done = False
+        s.long_size = 0.0
+        s.short_size = 0.0
+        s.long_pnl = 0.0
+        s.short_pnl = 0.0
+        s.long_pos_nonzero = False
+        s.short_pos_nonzero = False
+        s.long_pnl_sign = 0
+        s.short_pnl_sign = 0
+        s.long_steps_filled = 0
+        s.short_steps_filled = 0
+        s.news_block = False
+        s.cb_block = False
+        s.line_memory_long.clear()
+        s.line_memory_short.clear()
+
+        # TP 런타임 필드: 기존에는 새 BotState 생성으로 암묵 초기화되던 값
+        s.long_tp_active = False
+        s.long_tp_max_index = 0
+        s.short_tp_active = False
+        s.short_tp_max_index = 0
+
+        # 스냅샷 강제 저장 + line_memory WAL truncate
+        self.compact()
         logger.info(
             "Wave reset 완료: wave_id=%s mode=%s p_center=%.2f p_gap=%.2f atr=%.2f "
             "long_eff=%.2f short_eff=%.2f",
@@ -449,40 +787,48 @@ class StateManager:
     # LineMemory FSM API
     # ==================================================================
 
-    def _get_line_memory_ref(self, side: str) -> Dict[int, LineState]:
+    def _mem_ref(self, slot: int) -> Dict[int, LineState]:
+        """
+        slot(0=LONG, 1=SHORT)별 line_memory dict 반환 (참조 캐시).
+        - 캐시는 state 교체 시 무효화 (state setter 참조)
+        """
+        refs = self._mem_refs
+        if refs is None:
+            st = self.state
+            refs = (st.line_memory_long, st.line_memory_short)
+            self._mem_refs = refs
+        return refs[slot]
+
+    def _get_line_memory_ref(self, side: Any) -> Dict[int, LineState]:
         """
         방향별 line_memory dict 반환.
-        - side: "LONG" / "SHORT"
+        - side: "LONG" / "SHORT" (대소문자 무관) 또는 Side 코드
         """
-        s = side.upper()
-        if s == "LONG":
-            return self.state.line_memory_long
-        if s == "SHORT":
-            return self.state.line_memory_short
-        raise ValueError(f"invalid side for line memory: {side!r}")
+        return self._mem_ref(_side_slot(side))
 
-    def get_line_state(self, side: str, grid_index: int) -> LineState:
+    def get_line_state(self, side: Any, grid_index: int) -> LineState:
         """
         주어진 방향/라인 인덱스의 LineState 조회.
         - dict 에 없는 경우 FREE 로 취급.
         """
-        mem = self._get_line_memory_ref(side)
+        mem = self._mem_ref(_side_slot(side))
         return mem.get(int(grid_index), LineState.FREE)
 
-    def mark_line_open(self, side: str, grid_index: int) -> LineState:
+    def mark_line_open(self, side: Any, grid_index: int) -> LineState:
         """
         엔트리 시점: 해당 grid_index 를 OPEN 상태로 마킹.
         - line_memory write 는 반드시 이 함수를 통해 수행하도록 설계.
         """
         idx = int(grid_index)
-        mem = self._get_line_memory_ref(side)
+        slot = _side_slot(side)
+        mem = self._mem_ref(slot)
         mem[idx] = LineState.OPEN
-        self.save_state()
+        self._wal_append(slot, idx, LineState.OPEN)
 
-        logger.debug("Line OPEN: side=%s idx=%s", side.upper(), idx)
+        logger.debug("Line OPEN: side=%s idx=%s", _SIDE_NAME[slot], idx)
         return mem[idx]
 
-    def update_line_state(self, side: str, grid_index: int, outcome: str) -> LineState:
+    def update_line_state(self, side: Any, grid_index: int, outcome: str) -> LineState:
         """
         포지션 종료 outcome 에 따른 LineMemory FSM 업데이트.
 
@@ -496,16 +842,19 @@ class StateManager:
         - LOCKED_LOSS 는 명시적으로 dict 에 저장
         """
         idx = int(grid_index)
-        mem = self._get_line_memory_ref(side)
+        slot = _side_slot(side)
+        mem = self._mem_ref(slot)
         outcome_norm = outcome.upper()
 
         if outcome_norm in ("PROFIT", "BREAKEVEN"):
             # FREE: dict에서 제거 → 기본값 FREE
             mem.pop(idx, None)
             new_state = LineState.FREE
+            self._wal_append(slot, idx, new_state)
         elif outcome_norm == "LOSS":
             mem[idx] = LineState.LOCKED_LOSS
             new_state = LineState.LOCKED_LOSS
+            self._wal_append(slot, idx, new_state)
         else:
             logger.warning(
                 "알 수 없는 outcome 으로 LineState 업데이트 시도: side=%s idx=%s outcome=%s",
@@ -516,11 +865,9 @@ class StateManager:
             # 상태 변경 없이 현재 상태 반환
             new_state = mem.get(idx, LineState.FREE)
 
-        self.save_state()
-
         logger.debug(
             "LineState 업데이트: side=%s idx=%s outcome=%s → %s",
-            side.upper(),
+            _SIDE_NAME[slot],
             idx,
             outcome_norm,
             new_state.value,
@@ -528,9 +875,39 @@ class StateManager:
         return new_state
 
 
-# 모듈 레벨 싱글톤 (기존 사용 패턴 고려)
-state_manager = StateManager()
-bot_state_manager = state_manager  # 필요시 별칭 사용
+def _build_fast_serializer(field_names) -> Any:
+    """
+    _PLAIN_FIELDS 로부터 dict 리터럴 한 개짜리 직렬화 함수를 codegen 으로 생성.
+    - 필드당 getattr/메서드 호출 오버헤드 없이 LOAD_ATTR 만 수행
+    - 필드 목록은 _REQUIRED_KEYS 단일 소스에서 나오므로 드리프트 없음
+    """
+    for name in field_names:
+        if not name.isidentifier():
+            raise ValueError(f"invalid field name for codegen: {name!r}")
+
+    body = ", ".join(f'"{name}": state.{name}' for name in field_names)
+    src = (
+        "def _fast_serialize(state, _ser_mem):\n"
+        "    return {" + body + ",\n"
+        '            "line_memory_long": _ser_mem(state.line_memory_long),\n'
+        '            "line_memory_short": _ser_mem(state.line_memory_short)}\n'
+    )
+    namespace: Dict[str, Any] = {}
+    exec(src, namespace)
+    return namespace["_fast_serialize"]
+
+
+try:
+    StateManager._fast_serialize = staticmethod(
+        _build_fast_serializer(StateManager._PLAIN_FIELDS)
+    )
+except Exception as _exc:  # codegen 실패 시 폴백 경로 사용
+    logger.error("BotState 직렬화 codegen 실패 → 폴백 경로 사용: %s", _exc)
+
+
+# NOTE: 과거에는 모듈 레벨에서 `state_manager = StateManager()` 를 eager 생성했으나,
+# import 만으로 상태 파일 I/O 비용이 발생해 제거했다.
+# 전역 인스턴스가 필요하면 get_state_manager() 를 사용할 것.
 
 # --- Global singleton accessor ---------------------------------------------
 
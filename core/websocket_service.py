@@ -32,6 +32,9 @@ class WebSocketService:
         self.api_key = BYBIT_API_KEY
         self.secret = BYBIT_SECRET_KEY
         self.symbol = SYMBOL
+        # Bybit WS payload 의 raw 심볼 표기 ("BTC/USDT:USDT" → "BTCUSDT")
+        # private/public 공통으로 이 값과 비교해야 한다 (config 값은 ccxt 표기)
+        self.ws_symbol = self.symbol.split(":", 1)[0].replace("/", "")
         self.running = True
         self._last_price_info_ts = 0.0
 
@@ -73,10 +76,7 @@ class WebSocketService:
                 await asyncio.sleep(10)
 
     async def _run_public(self):
-        ws_symbol = self.symbol
-        ws_symbol = ws_symbol.split(":", 1)[0]  # "BTC/USDT:USDT" -> "BTC/USDT"
-        ws_symbol = ws_symbol.replace("/", "")  # "BTC/USDT" -> "BTCUSDT"
-        topic = f"publicTrade.{ws_symbol}"
+        topic = f"publicTrade.{self.ws_symbol}"
         while self.running:
             try:
                 logger.info("WS: Connecting to Public Stream...")
@@ -130,7 +130,7 @@ class WebSocketService:
             # Bybit v5 position payload 처리
             # data_list 안에 여러 포지션이 들어올 수 있으므로, 동일 symbol만 필터링
             for item in data_list:
-                if item.get("symbol") != self.symbol:
+                if item.get("symbol") != self.ws_symbol:
                     continue
 
                 # 수량/평단 안전 파싱
@@ -181,7 +181,28 @@ class WebSocketService:
         elif topic == "order":
             # 주문 이벤트도 private activity로 간주
             self.shared_state["positions_last_update"] = time.time()
-            logger.info("WS: Order update received.")
+
+            # OrderManager 의 WS-fed fill state 갱신
+            # (60초 재배치 워커/헤지 대기가 REST get_order_status 대신 이 값을 읽는다)
+            # 순환 import 방지를 위해 지연 import
+            from core.order_manager import order_manager
+
+            for item in data_list:
+                if item.get("symbol") != self.ws_symbol:
+                    continue
+                oid = str(item.get("orderId", "") or "")
+                if not oid:
+                    continue
+                try:
+                    filled = float(item.get("cumExecQty", 0) or 0)
+                except (TypeError, ValueError):
+                    continue
+                status = item.get("orderStatus", "")
+                terminal = status in ("Filled", "Cancelled", "Rejected", "Deactivated")
+                order_manager.notify_order_update(oid, filled, terminal=terminal)
+                logger.info(
+                    "WS: Order update oid=%s status=%s cumExecQty=%.6f", oid, status, filled
+                )
 
     def _handle_public(self, msg: Dict[str, Any]):
         topic = msg.get("topic")
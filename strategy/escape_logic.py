@@ -10,6 +10,7 @@ from .state_model import (
     AccountState,
     WaveState,
     OrderSpec,
+    norm_token,
 )
 from .capital import CapitalManager
 from .feed_types import StrategyFeed
@@ -72,6 +73,13 @@ class EscapeOrderSpec:
     side: str           # "LONG" | "SHORT"
     qty: float          # BTC
 
+    def __post_init__(self) -> None:
+        # OrderManager 소비 시점의 str(... or "").upper().strip() 반복을 제거하기 위해
+        # 생성 시점에 1회만 정규화한다.
+        self.type = norm_token(self.type)
+        self.side = norm_token(self.side)
+        self.qty = float(self.qty or 0.0)
+
 
 @dataclass
 class EscapeDecision:
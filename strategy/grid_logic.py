@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import List, Dict, Any, Tuple, Optional
 
 from strategy.feed_types import StrategyFeed, OrderInfo
-from strategy.state_model import LineState
+from strategy.state_model import LineState, norm_token
 from utils.logger import logger, get_logger
 from utils.calculator import calc_contract_qty
 from strategy.capital import CapitalManager
@@ -30,6 +30,16 @@ class GridOrderSpec:
     reduce_only: bool = False
     position_idx: Optional[int] = None  # 1=LONG, 2=SHORT
 
+    def __post_init__(self) -> None:
+        # 소비 측(OrderManager)의 getattr/str(...).upper().strip() 체인을 없애기 위해
+        # 생성 시점에 1회만 정규화한다.
+        self.side = norm_token(self.side)
+        self.price = float(self.price or 0.0)
+        self.qty = float(self.qty or 0.0)
+        self.grid_index = int(self.grid_index if self.grid_index is not None else -1)
+        self.wave_id = int(self.wave_id or 0)
+        self.reduce_only = bool(self.reduce_only)
+
 # ------------------------------
 # GridDecision
 # ------------------------------
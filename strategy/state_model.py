@@ -5,6 +5,29 @@ from typing import Optional, Literal, List, Dict
 from enum import Enum
 
 
+# ==============================
+# 공용 토큰 정규화 (side/type)
+# ==============================
+
+# 흔한 표기를 canonical 대문자 str 로 미리 매핑 — 핫 경로에서 .upper().strip()
+# 신규 문자열 할당을 피한다. 테이블 미스(희귀)만 일반 정규화로 떨어진다.
+_TOKEN_INTERN: Dict[str, str] = {
+    "BUY": "BUY", "buy": "BUY", "Buy": "BUY",
+    "SELL": "SELL", "sell": "SELL", "Sell": "SELL",
+    "LONG": "LONG", "long": "LONG", "Long": "LONG",
+    "SHORT": "SHORT", "short": "SHORT", "Short": "SHORT",
+    "HEDGE_ENTRY": "HEDGE_ENTRY", "HEDGE_EXIT": "HEDGE_EXIT",
+    "": "",
+}
+
+
+def norm_token(x: object) -> str:
+    """side/type 토큰 정규화(대문자) — canonical 값은 할당 없이 그대로 반환."""
+    s = x if isinstance(x, str) else str(x or "")
+    v = _TOKEN_INTERN.get(s)
+    return v if v is not None else s.upper().strip()
+
+
 # ==============================
 # 포지션 / 마켓 / 계정 상태 모델
 # ==============================
@@ -129,6 +152,8 @@ LineMemory = Dict[int, LineState]
 # Bot 상태 모델 (Wave/Grid/Seed/LineMemory)
 # ==============================
 
+# NOTE: slots 미사용 — GridLogic/WaveBot 이 dca_*/prev_*/total_balance 등
+# 런타임 스태시 필드를 동적으로 setattr 하는 패턴에 의존한다.
 @dataclass
 class BotState:
     """
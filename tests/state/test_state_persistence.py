@@ -0,0 +1,151 @@
+import json
+import os
+
+import core.state_manager as sm_mod
+from core.state_manager import StateManager
+from strategy.state_model import LineState
+
+
+def _make_manager(tmp_path) -> StateManager:
+    """tmp 경로를 쓰는 StateManager 생성 (전역 STATE_FILE_PATH 와 분리)."""
+    return StateManager(state_file_path=str(tmp_path / "wave_state.json"))
+
+
+# ==============================
+# line_memory WAL: write → replay
+# ==============================
+
+
+def test_wal_write_replay_roundtrip(tmp_path):
+    """
+    스냅샷 없이 WAL 레코드만으로 line_memory 가 복구되는지 검증.
+    - append 순서 = 시간 순서이므로 마지막 레코드가 이긴다
+    - FREE 전환(PROFIT)은 replay 후에도 FREE 여야 한다
+    """
+    sm = _make_manager(tmp_path)
+    sm.mark_line_open("LONG", 3)
+    sm.mark_line_open("SHORT", -2)
+    sm.update_line_state("LONG", 3, "LOSS")
+    sm.mark_line_open("LONG", 5)
+    sm.update_line_state("LONG", 5, "PROFIT")
+
+    # 새 인스턴스로 콜드 로드 (스냅샷 파일은 아직 없음 → WAL replay 경로)
+    sm2 = StateManager(state_file_path=sm.state_file_path)
+    assert sm2.get_line_state("LONG", 3) is LineState.LOCKED_LOSS
+    assert sm2.get_line_state("SHORT", -2) is LineState.OPEN
+    assert sm2.get_line_state("LONG", 5) is LineState.FREE
+    # 기록된 적 없는 인덱스는 FREE
+    assert sm2.get_line_state("SHORT", 0) is LineState.FREE
+
+
+def test_wal_replay_ignores_truncated_tail(tmp_path):
+    """
+    crash 등으로 WAL 꼬리에 6 bytes 미만의 불완전 레코드가 남아도,
+    완전한 레코드까지는 정상 적용하고 꼬리는 무시해야 한다.
+    """
+    sm = _make_manager(tmp_path)
+    sm.mark_line_open("LONG", 1)
+    sm.mark_line_open("SHORT", 2)
+
+    # 불완전 레코드 흉내: 레코드 크기(6B) 미만의 쓰레기 바이트 append
+    with open(sm.wal_file_path, "ab") as f:
+        f.write(b"\x01\xff\x00")
+
+    sm2 = StateManager(state_file_path=sm.state_file_path)
+    assert sm2.get_line_state("LONG", 1) is LineState.OPEN
+    assert sm2.get_line_state("SHORT", 2) is LineState.OPEN
+
+
+def test_wal_replay_survives_corrupt_snapshot(tmp_path):
+    """
+    스냅샷이 깨져(빈 파일 등) 기본 상태로 복구되는 경로에서도
+    WAL 은 replay 되어야 한다 — loss-lock 이 풀리면 재진입이 열려버린다.
+    """
+    sm = _make_manager(tmp_path)
+    sm.mark_line_open("LONG", 3)
+    sm.update_line_state("LONG", 3, "LOSS")
+
+    # 빈 스냅샷: non-fsync 주기 쓰기 crash 의 전형적 잔해 (mmap 불가 → 예외 경로)
+    with open(sm.state_file_path, "wb"):
+        pass
+
+    sm2 = StateManager(state_file_path=sm.state_file_path)
+    assert sm2.get_line_state("LONG", 3) is LineState.LOCKED_LOSS
+
+
+def test_compact_truncates_wal(tmp_path):
+    """compact() 후 WAL 은 비어 있고, 상태는 스냅샷에서 복구되어야 한다."""
+    sm = _make_manager(tmp_path)
+    sm.mark_line_open("LONG", 4)
+    sm.compact()
+
+    assert os.path.getsize(sm.wal_file_path) == 0
+
+    sm2 = StateManager(state_file_path=sm.state_file_path)
+    assert sm2.get_line_state("LONG", 4) is LineState.OPEN
+
+
+# ==============================
+# 스냅샷 포맷 우선순위 (msgpack vs JSON)
+# ==============================
+
+
+class _JsonAsMsgpack:
+    """
+    포맷 선택 로직 테스트용 msgpack 대역.
+    - 이 테스트 환경에는 msgpack 이 없을 수 있으므로, JSON 인코딩을 그대로 쓰는
+      최소 스텁으로 "msgpack 설치됨" 상황을 재현한다
+    """
+
+    @staticmethod
+    def unpackb(buf, raw=False):
+        return json.loads(bytes(buf))
+
+    @staticmethod
+    def packb(obj, use_bin_type=True):
+        return json.dumps(obj).encode("utf-8")
+
+
+def _write_snapshots(sm: StateManager, json_wave_id: int, mp_wave_id: int) -> None:
+    """JSON / msgpack 스냅샷을 서로 다른 wave_id 로 나란히 기록."""
+    base = sm._serialize_bot_state(sm._default_bot_state())
+
+    base["wave_id"] = json_wave_id
+    with open(sm.state_file_path, "w", encoding="utf-8") as f:
+        json.dump(base, f)
+
+    base["wave_id"] = mp_wave_id
+    with open(sm.msgpack_file_path, "wb") as f:
+        f.write(_JsonAsMsgpack.packb(base))
+
+
+def test_load_prefers_newer_json_snapshot(tmp_path, monkeypatch):
+    """
+    .msgpack / .json 스냅샷이 둘 다 있을 때 JSON 이 더 최신이면
+    (예: msgpack 이 한동안 제거된 사이 JSON 만 갱신) JSON 을 읽어야 한다.
+    msgpack 쪽을 무조건 읽으면 stale 한 wave 상태가 되살아난다.
+    """
+    monkeypatch.setattr(sm_mod, "msgpack", _JsonAsMsgpack)
+
+    sm = _make_manager(tmp_path)
+    _write_snapshots(sm, json_wave_id=7, mp_wave_id=3)
+
+    t = 1_700_000_000
+    os.utime(sm.msgpack_file_path, (t, t))
+    os.utime(sm.state_file_path, (t + 60, t + 60))
+
+    assert sm.state.wave_id == 7
+
+
+def test_load_prefers_newer_msgpack_snapshot(tmp_path, monkeypatch):
+    """반대 방향: msgpack 스냅샷이 더 최신이면 msgpack 을 읽어야 한다."""
+    monkeypatch.setattr(sm_mod, "msgpack", _JsonAsMsgpack)
+
+    sm = _make_manager(tmp_path)
+    _write_snapshots(sm, json_wave_id=7, mp_wave_id=3)
+
+    t = 1_700_000_000
+    os.utime(sm.state_file_path, (t, t))
+    os.utime(sm.msgpack_file_path, (t + 60, t + 60))
+
+    assert sm.state.wave_id == 3
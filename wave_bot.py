@@ -236,7 +236,9 @@ class WaveBot:
         """
         raw_state = self.state_manager.state
 
-        # dict / dataclass 공통 처리
+        # dict / dataclass 공통 처리.
+        # ※ dataclasses.fields() 가 아니라 __dict__ 를 읽어야 한다 —
+        #   total_balance 등 선언되지 않은 런타임 스태시 필드도 포함해야 함.
         if isinstance(raw_state, dict):
             s = dict(raw_state)
         else: